@@ -9,19 +9,24 @@ import streamlit as st
 import sys
 from pathlib import Path
 from datetime import datetime
+import asyncio
+from collections import deque
+from functools import lru_cache, partial
+from itertools import groupby, islice
+from operator import itemgetter
 import json
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from session import DebateSession, generate_session_name, generate_continuation_strategy
-from dialectic_poc import Agent, Logger, Observer
-from debate_graph import NodeType, EdgeType
-from agent_generation import generate_agent_ensemble
-from phase2_observer_generation import generate_observer_ensemble
-import tempfile
+from dialectic_poc import (
+    Agent, DebateTurn, Observer, FOLLOWUP_PROMPT,
+    aidentify_branches_batch, llm_call_async, llm_call_stream, trim_to_token_budget
+)
+from debate_graph import Edge, NodeType, EdgeType
+from node_factory import NodeFactory, format_transcript
+from dag_layout import layered_layout
 import os
-import glob
 
 # Page configuration
 st.set_page_config(
@@ -31,96 +36,117 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for chat bubbles
-st.markdown("""
-<style>
-.chat-message {
-    padding: 1rem;
-    border-radius: 0.5rem;
-    margin-bottom: 1rem;
-    display: flex;
-    flex-direction: column;
-    color: #1a1a1a;
-}
-.literalist, .agent-0 {
-    background-color: #e3f2fd;
-    border-left: 4px solid #1976d2;
-}
-.symbolist, .agent-1 {
-    background-color: #f3e5f5;
-    border-left: 4px solid #7b1fa2;
-}
-.structuralist, .agent-2 {
-    background-color: #e8f5e9;
-    border-left: 4px solid #388e3c;
-}
-.agent-3 {
-    background-color: #fff3e0;
-    border-left: 4px solid #f57c00;
-}
-.agent-4 {
-    background-color: #fce4ec;
-    border-left: 4px solid #c2185b;
+# Helper functions for session state
+def _pop_state(*keys):
+    """Remove keys from st.session_state, ignoring ones that aren't set"""
+    for key in keys:
+        if key in st.session_state:
+            del st.session_state[key]
+
+def _rerun_debate():
+    """Rerun just the debate tab to advance to the next turn
+
+    Only the chat fragment needs redrawing between turns; the sidebar,
+    graph and narrative are left alone. A fragment-scoped rerun is only
+    allowed during a fragment rerun, so the first turn after a full-app
+    run falls back to rerunning the app.
+    """
+    from streamlit.errors import StreamlitAPIException
+
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+# Chat avatars by agent speaking position
+AVATARS = ('📖', '✨', '🏛️', '🎨', '🔬')
+
+def agent_avatar(agent_idx: int) -> str:
+    """Avatar for the agent at this speaking position"""
+    return AVATARS[agent_idx] if agent_idx < len(AVATARS) else '🤔'
+
+# Graph colors, keyed by NodeType / EdgeType value
+NODE_COLORS = {
+    NodeType.SYNTHESIS.value: 'lightgreen',
+    NodeType.IMPASSE.value: 'lightcoral',
+    NodeType.EXPLORATION.value: 'lightblue',
 }
-.agent-name {
-    font-weight: bold;
-    margin-bottom: 0.5rem;
+EDGE_COLORS = {
+    EdgeType.BRANCHES_FROM.value: 'blue',
+    EdgeType.CONTRADICTS.value: 'red',
 }
-.round-badge {
-    background-color: #666;
-    color: white;
-    padding: 0.2rem 0.5rem;
-    border-radius: 0.3rem;
-    font-size: 0.8rem;
-    display: inline-block;
-    margin-left: 0.5rem;
+NODE_EMOJI = {
+    NodeType.SYNTHESIS: "🟢",
+    NodeType.IMPASSE: "🔴",
+    NodeType.EXPLORATION: "🔵",
 }
-.node-card {
-    border: 1px solid #ddd;
-    border-radius: 0.5rem;
-    padding: 1rem;
-    margin-bottom: 1rem;
-}
-.node-header {
-    font-weight: bold;
-    color: #1976d2;
-    margin-bottom: 0.5rem;
-}
-.tag {
-    background-color: #e0e0e0;
-    padding: 0.2rem 0.5rem;
-    border-radius: 0.3rem;
-    font-size: 0.8rem;
-    margin-right: 0.3rem;
-    display: inline-block;
-}
-</style>
-""", unsafe_allow_html=True)
+
+# Chat blocks emitted per rerun; older ones are only rendered on request
+CHAT_RENDER_WINDOW = 200
 
 # Helper functions for session management
-def get_saved_sessions():
-    """Get list of all saved sessions from output directory"""
-    output_dir = Path("output")
-    if not output_dir.exists():
-        return []
+@st.cache_data(ttl=30, show_spinner=False)
+def _scan_sessions(output_mtime_ns: int):
+    """Scan output directory for saved sessions (cached per directory mtime)
 
+    Paths are stored as strings so the cached value stays serializable.
+    """
     sessions = []
-    for session_dir in output_dir.iterdir():
-        if session_dir.is_dir():
-            # Look for DAG file
-            dag_files = list(session_dir.glob("*_dag.json"))
-            if dag_files:
-                sessions.append({
-                    'name': session_dir.name,
-                    'path': session_dir,
-                    'dag_path': dag_files[0],
-                    'modified': dag_files[0].stat().st_mtime
-                })
+    with os.scandir("output") as session_dirs:
+        for session_dir in session_dirs:
+            # DirEntry answers from d_type, no stat needed
+            if not session_dir.is_dir(follow_symlinks=False):
+                continue
+
+            # Look for the DAG file DebateSession will load (<name>_dag.json);
+            # a single stat, no per-directory listing or pattern matching
+            dag_path = os.path.join(session_dir.path, f"{session_dir.name}_dag.json")
+            try:
+                dag_stat = os.stat(dag_path)
+            except FileNotFoundError:
+                continue
+
+            sessions.append({
+                'name': session_dir.name,
+                'path': session_dir.path,
+                'dag_path': dag_path,
+                'modified': dag_stat.st_mtime,
+                # Selector label, formatted once per scan rather than per rerun
+                'label': format_session_option(session_dir.name, dag_stat.st_mtime)
+            })
 
     # Sort by modification time (newest first)
-    sessions.sort(key=lambda x: x['modified'], reverse=True)
+    sessions.sort(key=itemgetter('modified'), reverse=True)
     return sessions
 
+def get_saved_sessions():
+    """Get list of all saved sessions from output directory"""
+    try:
+        output_mtime_ns = os.stat("output").st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    return _scan_sessions(output_mtime_ns)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _load_dag_data(dag_path: str, dag_mtime_ns: int) -> dict:
+    """Parsed DAG file of a saved session (cached per file mtime)
+
+    st.cache_data hands every caller its own copy, so sessions built from it
+    never share state across browser sessions.
+    """
+    with open(dag_path, 'r') as f:
+        return json.load(f)
+
+def load_session(session_name: str, dag_path: str):
+    """Build a fresh DebateSession for this browser session from a saved DAG"""
+    from session import DebateSession
+    from debate_graph import DebateDAG
+
+    dag_data = _load_dag_data(dag_path, os.stat(dag_path).st_mtime_ns)
+    return DebateSession(session_name, autosave=False, dag=DebateDAG.from_dict(dag_data))
+
+@lru_cache(maxsize=512)
 def format_session_display_name(session_name: str) -> str:
     """Format session name for display (remove timestamp, capitalize)"""
     # Try to remove timestamp pattern (YYYYMMDD_HHMMSS)
@@ -134,23 +160,551 @@ def format_session_display_name(session_name: str) -> str:
     # Capitalize and replace underscores with spaces for display
     return display_name.replace('_', ' ').title()
 
-# Initialize session state
-if 'session' not in st.session_state:
-    st.session_state.session = None
-if 'current_node' not in st.session_state:
-    st.session_state.current_node = None
-if 'debate_running' not in st.session_state:
-    st.session_state.debate_running = False
-if 'passage_for_naming' not in st.session_state:
-    st.session_state.passage_for_naming = None
-
-# Initialize session state early (before sidebar uses it)
-if 'agents' not in st.session_state:
-    st.session_state.agents = None
-if 'agents_confirmed' not in st.session_state:
-    st.session_state.agents_confirmed = False
-if 'debate_model' not in st.session_state:
-    st.session_state.debate_model = "electronhub/claude-sonnet-4-5-20250929"
+@lru_cache(maxsize=512)
+def format_session_option(session_name: str, modified: float) -> str:
+    """Label for the session selector: display name plus last-modified time"""
+    return f"{format_session_display_name(session_name)} ({datetime.fromtimestamp(modified).strftime('%m/%d %H:%M')})"
+
+# Helper functions for chat rendering
+def _chat_render_plan(chat_history: list) -> list:
+    """Group chat history into (role, payload) blocks ready to emit
+
+    Each agent turn is its own block, payload (avatar, markdown), so it
+    keeps its avatar; consecutive user/system messages become one markdown
+    string (one bubble). The chat is only ever appended to or replaced
+    wholesale, so the plan is kept in session state. When the same list has
+    grown, only its last group and the new messages are regrouped; a
+    different list is planned from scratch.
+    """
+    state = st.session_state
+    if state.get('_chat_plan_src') is chat_history and state._chat_plan_len == len(chat_history):
+        return state._chat_plan
+
+    if (state.get('_chat_plan_src') is chat_history and state._chat_plan
+            and state._chat_plan_len < len(chat_history)):
+        # Appended since last time: only the last group can have grown
+        plan = state._chat_plan[:state._chat_plan_last_block]
+        start = state._chat_plan_last_start
+    else:
+        plan, start = [], 0
+
+    last_start, last_block = start, len(plan)
+    for role, msgs in groupby(islice(chat_history, start, None), key=itemgetter('role')):
+        msgs = list(msgs)
+        last_start, last_block = start, len(plan)
+        start += len(msgs)
+        if role == 'agent':
+            plan.extend(
+                (role, (m.get('avatar', '🤔'), f"**{m['name']}** (Round {m.get('round', '?')})\n\n{m['content']}"))
+                for m in msgs
+            )
+        else:
+            plan.append((role, "\n\n".join(m['content'] for m in msgs)))
+
+    # Hold the list itself (not its id) so a replacement list is never mistaken for it
+    state._chat_plan_src = chat_history
+    state._chat_plan_len = len(chat_history)
+    state._chat_plan_last_start = last_start
+    state._chat_plan_last_block = last_block
+    state._chat_plan = plan
+    return plan
+
+@st.cache_data(show_spinner=False)
+def _hydrate_chat_from_node(_node, node_id: str) -> list:
+    """Build the chat history for a saved node
+
+    Nodes don't change once created, so this is cached per node_id (the
+    node itself isn't hashed). st.cache_data hands back a fresh copy each
+    time, so callers can append to the returned list.
+    """
+    chat_history = []
+
+    # Add passage/question context
+    if _node.passage:
+        chat_history.append({
+            'role': 'user',
+            'content': f"**Passage to debate:**\n\n{_node.passage}"
+        })
+    elif _node.branch_question:
+        chat_history.append({
+            'role': 'system',
+            'content': f"**Branch Question:** {_node.branch_question}"
+        })
+
+    # Add debate turns with avatars
+    if _node.turns_data:
+        # Avatars by speaking position (first appearance in the turns)
+        agent_order = dict.fromkeys(turn['agent_name'] for turn in _node.turns_data)
+        agent_to_index = {name: i for i, name in enumerate(agent_order)}
+        chat_history.extend(
+            {
+                'role': 'agent',
+                'name': turn['agent_name'],
+                'content': turn['content'],
+                'round': turn['round_num'],
+                'avatar': agent_avatar(agent_to_index[turn['agent_name']])
+            }
+            for turn in _node.turns_data
+        )
+
+    # Add resolution as system message
+    chat_history.append({
+        'role': 'system',
+        'content': f"**Resolution ({_node.node_type.value}):**\n\n{_node.resolution}"
+    })
+
+    # Add key claims if available
+    if _node.key_claims:
+        claims_text = "\n".join(f"• {claim}" for claim in _node.key_claims)
+        chat_history.append({
+            'role': 'system',
+            'content': f"**Key Claims:**\n{claims_text}"
+        })
+
+    # Add theme tags if available
+    if _node.theme_tags:
+        tags_text = " ".join(f"#{tag}" for tag in sorted(_node.theme_tags))
+        chat_history.append({
+            'role': 'system',
+            'content': f"**Themes:** {tags_text}"
+        })
+
+    return chat_history
+
+# Helper functions for agent/observer generation (paid LLM calls, cached per passage)
+# Multi-model ensemble for genuine diversity
+AGENT_MODELS = (
+    "electronhub/claude-sonnet-4-5-20250929",
+    "electronhub/gpt-5.1",
+    "electronhub/gemini-2.5-flash"
+)
+
+def _generate_agent_dicts(passage: str, num_agents: int, models: tuple) -> list:
+    """Generate agents for a passage, returned as Agent.to_dict() dicts
+
+    Dicts keep the cached value serializable; rebuild with Agent.from_dict.
+    """
+    from agent_generation import generate_agent_ensemble
+
+    agents = generate_agent_ensemble(
+        passage,
+        num_agents=num_agents,
+        verbose=False,
+        models=list(models)
+    )
+    return [agent.to_dict() for agent in agents]
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_agent_ensemble(passage: str, num_agents: int, models: tuple) -> list:
+    """_generate_agent_dicts, cached per passage/agent count/models"""
+    return _generate_agent_dicts(passage, num_agents, models)
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_observer_ensemble(passage: str, num_perspectives: int) -> list:
+    """Generate observer profile dicts for a passage"""
+    from phase2_observer_generation import generate_observer_ensemble
+
+    return generate_observer_ensemble(
+        passage,
+        num_perspectives=num_perspectives,
+        verbose=False
+    )
+
+# Helper functions for debate prompts
+OPENING_PROMPT = "Provide your opening analysis."
+
+def debate_subject(state: dict) -> str:
+    """The passage or branch question a debate is about, as quoted to agents"""
+    if state['debate_type'] == 'branch':
+        return f"Question to explore:\n{state['branch_question']}"
+    return f"Passage:\n{state['passage']}"
+
+def debate_system_prompt(agent, subject: str) -> str:
+    """System prompt for every turn an agent takes in one debate
+
+    Agent identity plus the debate subject: byte-identical across the
+    agent's turns, so providers can reuse the cached prefix. Only the user
+    message (recent discussion) changes from turn to turn.
+    """
+    return f"{agent.get_system_prompt()}\n\n{subject}"
+
+def turn_prompt(state: dict, agents) -> str:
+    """User message for the current round: the opening ask, then recent turns"""
+    if state['round'] == 1:
+        return OPENING_PROMPT
+    return FOLLOWUP_PROMPT.format(
+        recent_turns="\n\n".join(trim_to_token_budget(recent_turn_lines(state, agents)))
+    )
+
+def recent_turn_lines(state: dict, agents) -> deque:
+    """Formatted "name: content" lines for the last two rounds of a debate
+
+    Kept in the debate state and appended to as turns arrive, so building
+    the next prompt doesn't re-slice and re-format the whole transcript.
+    """
+    if 'recent_turns' not in state:
+        state['recent_turns'] = deque(
+            (f"{t.agent_name}: {t.content}" for t in state['transcript']),
+            maxlen=len(agents) * 2
+        )
+    return state['recent_turns']
+
+# Helper functions for auto-branching
+async def identify_branches(observers, transcript_text: str, passage: str, max_concurrency: int = 4) -> list:
+    """Ask every observer for a branch question
+
+    Tries a single batched call first (the transcript is sent once rather
+    than once per observer). If that response can't be parsed, falls back
+    to one call per observer, with a semaphore capping in-flight LLM calls
+    to stay within rate limits.
+    Returns questions in the same order as observers.
+    """
+    if len(observers) > 1:
+        try:
+            return await aidentify_branches_batch(observers, transcript_text, passage)
+        except ValueError as e:
+            st.toast(f"Batched branch identification failed ({e}); asking observers individually", icon="⚠️")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def identify(observer):
+        async with semaphore:
+            return await observer.aidentify_branch(transcript_text, passage)
+
+    return await asyncio.gather(*(identify(observer) for observer in observers))
+
+async def round_responses(agents, subject: str, user_prompt: str) -> list:
+    """Generate every agent's response to the same user prompt concurrently
+
+    Used for opening statements, which only depend on the passage/question,
+    and for later rounds when agents answer the same snapshot of previous
+    rounds rather than each other's turns in the current one.
+    Returns responses in the same order as agents.
+    """
+    return await asyncio.gather(*(
+        llm_call_async(
+            debate_system_prompt(agent, subject),
+            user_prompt,
+            temperature=0.7,
+            model=agent.model
+        )
+        for agent in agents
+    ))
+
+# Branch debates allowed in flight at once in parallel mode (each can have
+# every agent's call in flight too, so keep this well under provider limits)
+MAX_PARALLEL_BRANCHES = 3
+
+async def branch_debate(state: dict, agents, parallel_first_round: bool, parallel_later: bool) -> None:
+    """Run every round of a branch debate in one go, filling state['transcript']
+
+    Takes the same turns as the progressive path, just without a rerun per
+    turn: each agent on its own model, one after another unless the round is
+    set to run concurrently.
+    """
+    subject = debate_subject(state)
+
+    def record(agent, response):
+        response = response.strip()
+        recent_turn_lines(state, agents).append(f"{agent.name}: {response}")
+        state['transcript'].append(DebateTurn(agent.name, response, state['round']))
+
+    while state['round'] <= state['max_rounds']:
+        if len(agents) > 1 and (parallel_first_round if state['round'] == 1 else parallel_later):
+            responses = await round_responses(agents, subject, turn_prompt(state, agents))
+            for agent, response in zip(agents, responses):
+                record(agent, response)
+        else:
+            for agent in agents:
+                record(agent, await llm_call_async(
+                    debate_system_prompt(agent, subject),
+                    turn_prompt(state, agents),
+                    temperature=0.7,
+                    model=agent.model
+                ))
+        state['round'] += 1
+
+async def parallel_branch_debates(states: list, agents, parallel_first_round: bool, parallel_later: bool,
+                                  max_concurrency: int = MAX_PARALLEL_BRANCHES) -> list:
+    """Debate and summarize several branches at once
+
+    The summary for each branch runs in a worker thread as soon as its
+    debate finishes, so it overlaps with the branches still debating.
+    Nodes aren't added to the DAG here; that stays with the caller.
+    Returns nodes in the same order as states.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def run(state):
+        async with semaphore:
+            await branch_debate(state, agents, parallel_first_round, parallel_later)
+            return await loop.run_in_executor(None, partial(
+                NodeFactory.create_node_from_transcript,
+                node_type=NodeType.EXPLORATION,
+                transcript=state['transcript'],
+                passage=None,
+                branch_question=state['branch_question'],
+                transcript_text=format_transcript(state['transcript'])
+            ))
+
+    return await asyncio.gather(*(run(state) for state in states))
+
+def add_branch_node(session, node, parent_node_id: str, branch_question: str):
+    """Add a branch node and its BRANCHES_FROM edge, leaving the write for flush_if_dirty"""
+    session.dag.add_node(node)
+    if parent_node_id:
+        session.dag.add_edge(Edge(
+            from_node_id=parent_node_id,
+            to_node_id=node.node_id,
+            edge_type=EdgeType.BRANCHES_FROM,
+            description=f"Branch: {branch_question[:50]}..."
+        ))
+    session.mark_dirty()
+
+def node_summary_messages(node) -> list:
+    """System chat messages summarizing a finished debate node
+
+    Resolution, then key claims and theme tags when the node has them.
+    """
+    messages = [{
+        'role': 'system',
+        'content': f"**Resolution ({node.node_type.value}):**\n\n{node.resolution}"
+    }]
+
+    if node.key_claims:
+        claims_text = "\n".join([f"• {claim}" for claim in node.key_claims])
+        messages.append({
+            'role': 'system',
+            'content': f"**Key Claims:**\n{claims_text}"
+        })
+
+    if node.theme_tags:
+        tags_text = " ".join([f"#{tag}" for tag in sorted(node.theme_tags)])
+        messages.append({
+            'role': 'system',
+            'content': f"**Themes:** {tags_text}"
+        })
+
+    return messages
+
+# Helper functions for DAG rendering caches
+def dag_fingerprint(session) -> tuple:
+    """Cache key for a session's DAG contents: (session_name, DAG instance_id, dag_version)
+
+    Each browser session loads its own DAG object, so the instance id keeps
+    two users of the same saved session (same name, maybe the same revision
+    count, different nodes) from sharing cached views. Unlike id(), it is
+    never reused after a DAG is garbage-collected.
+    """
+    return (session.session_name, session.dag.instance_id, session.dag_version)
+
+@st.cache_data(show_spinner="Generating narrative...")
+def export_narrative_cached(_session, fingerprint: tuple) -> str:
+    """Export session narrative, cached per DAG fingerprint
+
+    The session itself is not hashed (leading underscore); the fingerprint
+    stands in for its contents.
+    """
+    return _session.export_narrative()
+
+@st.cache_data(show_spinner=False)
+def session_stats_cached(_session, fingerprint: tuple) -> dict:
+    """Session statistics for the sidebar, cached per DAG fingerprint"""
+    return _session.get_stats()
+
+@st.cache_data(show_spinner=False)
+def _node_selector_labels(_dag, fingerprint: tuple) -> dict:
+    """Map continuation selector labels to node IDs, in creation order"""
+    return {
+        f"Node {i+1} [{node.node_type.value.upper()}]: {node.concise_summary or node.topic[:50]}": node.node_id
+        for i, node in enumerate(_dag.get_all_nodes())
+    }
+
+@st.cache_data(show_spinner=False)
+def _dag_blobs(_dag, fingerprint: tuple) -> tuple:
+    """Hashable (nodes_blob, edges_blob) snapshot of the DAG for the render caches
+
+    Rebuilt only when the fingerprint changes, so plain reruns of the graph
+    tab don't walk every node and edge just to find a cache key.
+    """
+    nodes_blob = tuple(
+        (node_id, node.node_type.value, node.concise_summary or f"{node.topic[:30]}...")
+        for node_id, node in _dag.nodes.items()
+    )
+    edges_blob = tuple(
+        (edge.from_node_id, edge.to_node_id, edge.edge_type.value)
+        for edge in _dag.edges
+    )
+    return nodes_blob, edges_blob
+
+@st.cache_data(show_spinner=False)
+def _dag_layout(node_ids: tuple, edges: tuple) -> dict:
+    """Compute node positions for the DAG, cached on graph topology
+
+    Prefers Graphviz 'dot' (via pygraphviz, if installed), otherwise the
+    layered layout from dag_layout.
+    """
+    try:
+        import networkx as nx
+        from networkx.drawing.nx_agraph import graphviz_layout
+    except ImportError:
+        return layered_layout(node_ids, edges)
+
+    G = nx.DiGraph()
+    G.add_nodes_from(node_ids)
+    G.add_edges_from(edges)
+    try:
+        return graphviz_layout(G, prog='dot')
+    except ImportError:
+        return layered_layout(node_ids, edges)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _render_dag_plotly(fingerprint: tuple, nodes_blob: tuple, edges_blob: tuple):
+    """Build an interactive Plotly figure of the DAG, cached until the graph changes
+
+    Nodes and edges are WebGL traces, so the browser does the drawing and
+    pan/zoom; edge direction is shown with annotation arrowheads.
+
+    Cached as a resource: st.plotly_chart only reads the figure, so reruns
+    with an unchanged DAG share one object instead of unpickling a copy.
+
+    Args:
+        fingerprint: DAG fingerprint (see dag_fingerprint)
+        nodes_blob: (node_id, node_type value, label) per node, in insertion order
+        edges_blob: (from_node_id, to_node_id, edge_type value) per edge
+
+    Raises:
+        ImportError: If plotly or networkx is not installed
+    """
+    import numpy as np
+    import plotly.graph_objects as go
+
+    pos = _dag_layout(
+        tuple(node_id for node_id, _, _ in nodes_blob),
+        tuple((from_node_id, to_node_id) for from_node_id, to_node_id, _ in edges_blob)
+    )
+
+    fig = go.Figure()
+
+    # One line trace per edge color; NaN breaks the polyline between edges
+    edge_lines = {}
+    for from_node_id, to_node_id, edge_type in edges_blob:
+        color = EDGE_COLORS.get(edge_type, 'green')
+        (x0, y0), (x1, y1) = pos[from_node_id], pos[to_node_id]
+        xs, ys = edge_lines.setdefault(color, ([], []))
+        xs.extend((x0, x1, np.nan))
+        ys.extend((y0, y1, np.nan))
+        fig.add_annotation(
+            x=x1, y=y1, ax=x0, ay=y0,
+            xref='x', yref='y', axref='x', ayref='y',
+            showarrow=True, arrowhead=2, arrowsize=1.5, arrowcolor=color,
+            opacity=0.6, standoff=18, text=''
+        )
+
+    # Float arrays let plotly ship coordinates as typed binary, not JSON lists
+    for color, (xs, ys) in edge_lines.items():
+        fig.add_trace(go.Scattergl(
+            x=np.asarray(xs, dtype=np.float32), y=np.asarray(ys, dtype=np.float32), mode='lines',
+            line=dict(color=color, width=2), opacity=0.6, hoverinfo='skip'
+        ))
+
+    # Nodes, labelled with their number and concise summary
+    fig.add_trace(go.Scattergl(
+        x=np.fromiter((pos[node_id][0] for node_id, _, _ in nodes_blob), dtype=np.float32, count=len(nodes_blob)),
+        y=np.fromiter((pos[node_id][1] for node_id, _, _ in nodes_blob), dtype=np.float32, count=len(nodes_blob)),
+        mode='markers+text',
+        marker=dict(
+            color=[NODE_COLORS.get(node_type, 'lightgray') for _, node_type, _ in nodes_blob],
+            size=30, symbol='square', line=dict(width=1, color='#666')
+        ),
+        text=[f"{i}. {label}" for i, (_, _, label) in enumerate(nodes_blob, 1)],
+        textposition='bottom center',
+        hoverinfo='text'
+    ))
+
+    fig.update_layout(
+        showlegend=False,
+        height=600,
+        margin=dict(l=10, r=10, t=10, b=10),
+        plot_bgcolor='white',
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False)
+    )
+
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _render_dag_png(fingerprint: tuple, nodes_blob: tuple, edges_blob: tuple) -> bytes:
+    """Render the DAG to PNG bytes, cached until the graph changes
+
+    Args:
+        fingerprint: DAG fingerprint (see dag_fingerprint)
+        nodes_blob: (node_id, node_type value, label) per node, in insertion order
+        edges_blob: (from_node_id, to_node_id, edge_type value) per edge
+
+    Raises:
+        ImportError: If networkx or matplotlib is not installed
+    """
+    import networkx as nx
+    from matplotlib.figure import Figure
+    from io import BytesIO
+
+    # One pass over each blob: node IDs, colors and labels; edges and their colors
+    node_ids, node_colors, labels = [], [], {}
+    for i, (node_id, node_type, label) in enumerate(nodes_blob, 1):
+        node_ids.append(node_id)
+        node_colors.append(NODE_COLORS.get(node_type, 'lightgray'))
+        labels[node_id] = f"{i}.\n{label}"
+
+    edge_list, edge_colors = [], []
+    for from_node_id, to_node_id, edge_type in edges_blob:
+        edge_list.append((from_node_id, to_node_id))
+        edge_colors.append(EDGE_COLORS.get(edge_type, 'green'))
+
+    G = nx.DiGraph()
+    G.add_nodes_from(node_ids)
+    G.add_edges_from(edge_list)
+
+    # Layout
+    pos = _dag_layout(tuple(node_ids), tuple(edge_list))
+
+    # Draw (a bare Figure is never registered with pyplot, so nothing leaks across reruns)
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+
+    nx.draw_networkx_nodes(G, pos, node_color=node_colors, node_size=4000,
+                          alpha=0.9, node_shape='s', ax=ax)  # Square nodes for text
+    # Explicit edgelist: G.edges iterates by source node, not in edge_colors order
+    nx.draw_networkx_edges(G, pos, edgelist=edge_list,
+                          edge_color=edge_colors, arrows=True,
+                          arrowsize=20, width=2, alpha=0.6, ax=ax)
+
+    # Labels using concise summaries
+    nx.draw_networkx_labels(G, pos, labels, font_size=8, font_weight='normal', ax=ax)
+
+    ax.axis('off')
+    fig.tight_layout()
+
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=100)
+
+    return buf.getvalue()
+
+# Initialize session state (before the sidebar uses it), one pass over the defaults.
+# Lists are built fresh on every run, so no two sessions ever share one.
+for key, default in (
+    ('session', None),
+    ('current_node', None),
+    ('debate_running', False),
+    ('passage_for_naming', None),
+    ('agents', None),
+    ('agents_confirmed', False),
+    ('debate_model', "electronhub/claude-sonnet-4-5-20250929"),
+    ('chat_history', []),
+    ('current_debate_turns', []),
+):
+    st.session_state.setdefault(key, default)
 
 # Sidebar: Configuration
 st.sidebar.title("⚙️ Configuration")
@@ -226,6 +780,18 @@ if not use_auto_agents:
 st.sidebar.subheader("Debate Settings")
 max_rounds = st.sidebar.slider("Max Rounds (Main)", 2, 5, 3)
 branch_rounds = st.sidebar.slider("Max Rounds (Branch)", 1, 4, 2)
+parallel_within_round = st.sidebar.checkbox(
+    "⚡ Generate opening statements in parallel",
+    value=False,
+    key="parallel_within_round",
+    help="All agents give their opening statements at the same time. Faster, but turns arrive as one batch instead of streaming one agent after another."
+)
+parallel_later_rounds = st.sidebar.checkbox(
+    "⚡ Generate later rounds in parallel",
+    value=False,
+    key="parallel_later_rounds",
+    help="Each agent answers the previous rounds at the same time instead of hearing earlier speakers in the same round. Faster, but agents can't respond to each other within a round."
+)
 
 # Auto-branching toggle
 auto_branch = st.sidebar.checkbox(
@@ -237,6 +803,12 @@ auto_branch = st.sidebar.checkbox(
 if auto_branch:
     num_observers = st.sidebar.slider("Number of observers", 1, 3, 1,
                                       help="Generate multiple observers to explore different branch angles")
+    parallel_branches = st.sidebar.checkbox(
+        "⚡ Run branch debates in parallel",
+        value=False,
+        key="parallel_branches",
+        help="Debate every branch question at once and show the results when they're all done, instead of streaming branches one at a time"
+    )
 
 # Session management
 st.sidebar.subheader("📂 Session Management")
@@ -247,10 +819,7 @@ saved_sessions = get_saved_sessions()
 if saved_sessions:
     st.sidebar.markdown("**Load Previous Session:**")
 
-    session_options = {
-        f"{format_session_display_name(s['name'])} ({datetime.fromtimestamp(s['modified']).strftime('%m/%d %H:%M')})": s
-        for s in saved_sessions
-    }
+    session_options = {s['label']: s for s in saved_sessions}
 
     selected_session_label = st.sidebar.selectbox(
         "Select a session:",
@@ -263,15 +832,12 @@ if saved_sessions:
         with col1:
             if st.button("📂 Load Session", use_container_width=True):
                 selected_session = session_options[selected_session_label]
-                st.session_state.session = DebateSession(
-                    selected_session['name'],
-                    load_existing=True
-                )
+                session = load_session(selected_session['name'], selected_session['dag_path'])
+                st.session_state.session = session
 
-                # Load agents from first node if available
-                if st.session_state.session.dag.nodes:
-                    first_node = list(st.session_state.session.dag.nodes.values())[0]
-                    st.session_state.current_node = first_node
+                # Start from the first node (None for an empty session, so a
+                # previous session's node doesn't linger)
+                st.session_state.current_node = next(iter(session.dag.nodes.values()), None)
 
                 st.sidebar.success(f"✅ Loaded: {format_session_display_name(selected_session['name'])}")
                 st.rerun()
@@ -282,6 +848,8 @@ if saved_sessions:
                 import shutil
                 selected_session = session_options[selected_session_label]
                 shutil.rmtree(selected_session['path'])
+                _scan_sessions.clear()
+                _load_dag_data.clear()
                 st.sidebar.warning(f"Deleted: {selected_session['name']}")
                 st.rerun()
 
@@ -293,13 +861,14 @@ st.sidebar.markdown("**Create New Session:**")
 # Show current session info if loaded
 if st.session_state.session:
     st.sidebar.info(f"**Current:** {format_session_display_name(st.session_state.session.session_name)}")
-    stats = st.session_state.session.get_stats()
+    stats = session_stats_cached(st.session_state.session, dag_fingerprint(st.session_state.session))
     st.sidebar.markdown(f"_Nodes: {stats['total_nodes']}, Edges: {stats['total_edges']}_")
 else:
     st.sidebar.info("No session loaded. Create new or load existing.")
 
 if st.sidebar.button("➕ Create New Session"):
     # Will be created when debate starts with auto-generated name
+    _scan_sessions.clear()
     st.session_state.session = None
     st.session_state.current_node = None
     st.session_state.agents_confirmed = False
@@ -320,31 +889,31 @@ if st.sidebar.button("➕ Create New Session"):
 
     st.sidebar.success("✅ Ready for new session. Session name will be auto-generated from passage.")
 
-# Initialize chat history in session state
-if 'chat_history' not in st.session_state:
-    st.session_state.chat_history = []
-if 'current_debate_turns' not in st.session_state:
-    st.session_state.current_debate_turns = []
-
 # Main area: Tabs
 tab1, tab2, tab3 = st.tabs(["💬 Debate Chat", "🕸️ Graph", "📖 Narrative"])
 
 # TAB 1: Debate Chat (Unified Input + Live Debate)
-with tab1:
+@st.fragment
+def _tab_debate():
     st.header("💬 Debate Chat")
 
-    # Show existing debate history in chat format
-    for msg in st.session_state.chat_history:
-        if msg['role'] == 'user':
+    # Show existing debate history in chat format, most recent blocks only
+    plan = _chat_render_plan(st.session_state.chat_history)
+    hidden = len(plan) - CHAT_RENDER_WINDOW
+    if hidden > 0 and not st.checkbox(f"Show {hidden} earlier messages", key="show_full_chat"):
+        plan = plan[hidden:]
+
+    for role, payload in plan:
+        if role == 'agent':
+            avatar, text = payload
+            with st.chat_message("assistant", avatar=avatar):
+                st.markdown(text)
+        elif role == 'user':
             with st.chat_message("user"):
-                st.markdown(msg['content'])
-        elif msg['role'] == 'system':
+                st.markdown(payload)
+        elif role == 'system':
             with st.chat_message("assistant", avatar="🎭"):
-                st.markdown(msg['content'])
-        elif msg['role'] == 'agent':
-            with st.chat_message("assistant", avatar=msg.get('avatar', '🤔')):
-                st.markdown(f"**{msg['name']}** (Round {msg.get('round', '?')})")
-                st.markdown(msg['content'])
+                st.markdown(payload)
 
     # Input area at bottom (only show when not actively debating)
     if not st.session_state.debate_running and len(st.session_state.chat_history) == 0:
@@ -368,8 +937,11 @@ with tab1:
             # Auto-generate session name if no session exists
             if st.session_state.session is None:
                 with st.spinner("🔄 Generating session name..."):
+                    from session import DebateSession, generate_session_name
+
                     session_name = generate_session_name(passage)
-                    st.session_state.session = DebateSession(session_name)
+                    # The app batches DAG writes itself (see flush_if_dirty)
+                    st.session_state.session = DebateSession(session_name, autosave=False)
                     st.session_state.chat_history.append({
                         'role': 'system',
                         'content': f"📁 Created session: **{format_session_display_name(session_name)}**"
@@ -378,19 +950,8 @@ with tab1:
             # Generate agents if needed
             if st.session_state.agents is None:
                 with st.spinner(f"🤖 Generating {num_auto_agents} diverse debate agents..."):
-                    # Use multi-model approach for genuine diversity
-                    models = [
-                        "electronhub/claude-sonnet-4-5-20250929",
-                        "electronhub/gpt-5.1",
-                        "electronhub/gemini-2.5-flash"
-                    ]
-                    agents = generate_agent_ensemble(
-                        passage,
-                        num_agents=num_auto_agents,
-                        verbose=False,
-                        models=models
-                    )
-                    st.session_state.agents = agents
+                    agent_dicts = _cached_agent_ensemble(passage, num_auto_agents, AGENT_MODELS)
+                    st.session_state.agents = [Agent.from_dict(data) for data in agent_dicts]
 
             # Store passage for later use
             st.session_state.pending_passage = passage
@@ -465,7 +1026,6 @@ with tab1:
                 )
 
                 # Update agent with edited values, preserving extended fields
-                from dialectic_poc import Agent
                 edited_agent = Agent(name, stance, focus, model)
 
                 # Preserve extended fields from two-phase initialization
@@ -491,8 +1051,12 @@ with tab1:
 
         with col1:
             if st.button("🔄 Regenerate Agents", use_container_width=True):
-                # Clear agents to trigger regeneration
-                st.session_state.agents = None
+                # Skip the cache for a fresh ensemble; other passages' (and users') entries stay
+                with st.spinner(f"🤖 Generating {num_auto_agents} diverse debate agents..."):
+                    agent_dicts = _generate_agent_dicts(
+                        st.session_state.pending_passage, num_auto_agents, AGENT_MODELS
+                    )
+                st.session_state.agents = [Agent.from_dict(data) for data in agent_dicts]
                 st.rerun()
 
         with col2:
@@ -501,8 +1065,7 @@ with tab1:
                 st.session_state.agents = None
                 st.session_state.chat_history = []
                 st.session_state.session = None
-                if 'pending_passage' in st.session_state:
-                    del st.session_state.pending_passage
+                _pop_state('pending_passage')
                 st.rerun()
 
         with col3:
@@ -537,13 +1100,10 @@ with tab1:
 
             # Show available nodes
             if st.session_state.session.dag.nodes:
-                nodes = st.session_state.session.dag.get_all_nodes()
+                dag = st.session_state.session.dag
 
-                # Node selector
-                node_labels = {
-                    f"Node {i+1} [{node.node_type.value.upper()}]: {node.concise_summary or node.topic[:50]}": node
-                    for i, node in enumerate(nodes)
-                }
+                # Node selector labels, rebuilt only when the DAG changes
+                node_labels = _node_selector_labels(dag, dag_fingerprint(st.session_state.session))
 
                 selected_label = st.selectbox(
                     "Select a node to continue from:",
@@ -551,71 +1111,23 @@ with tab1:
                     index=len(node_labels)-1,  # Default to most recent node
                     key="continue_node_selector"
                 )
-                selected_node = node_labels[selected_label]
+                selected_node = dag.nodes[node_labels[selected_label]]
 
                 # Action buttons
                 col1, col2, col3 = st.columns(3)
 
                 with col1:
                     if st.button("📖 Load into Chat", use_container_width=True):
-                        # Clear current chat and load this node
-                        st.session_state.chat_history = []
-
-                        # Add passage/question context
-                        if selected_node.passage:
-                            st.session_state.chat_history.append({
-                                'role': 'user',
-                                'content': f"**Passage to debate:**\n\n{selected_node.passage}"
-                            })
-                        elif selected_node.branch_question:
-                            st.session_state.chat_history.append({
-                                'role': 'system',
-                                'content': f"**Branch Question:** {selected_node.branch_question}"
-                            })
-
-                        # Add debate turns with avatars
-                        if selected_node.turns_data:
-                            avatar_map = {0: '📖', 1: '✨', 2: '🏛️', 3: '🎨', 4: '🔬'}
-                            unique_agents = list(dict.fromkeys([t['agent_name'] for t in selected_node.turns_data]))
-                            agent_to_index = {name: i for i, name in enumerate(unique_agents)}
-
-                            for turn in selected_node.turns_data:
-                                agent_idx = agent_to_index.get(turn['agent_name'], 0)
-                                st.session_state.chat_history.append({
-                                    'role': 'agent',
-                                    'name': turn['agent_name'],
-                                    'content': turn['content'],
-                                    'round': turn['round_num'],
-                                    'avatar': avatar_map.get(agent_idx, '🤔')
-                                })
-
-                        # Add resolution as system message
-                        st.session_state.chat_history.append({
-                            'role': 'system',
-                            'content': f"**Resolution ({selected_node.node_type.value}):**\n\n{selected_node.resolution}"
-                        })
-
-                        # Add key claims if available
-                        if selected_node.key_claims:
-                            claims_text = "\n".join([f"• {claim}" for claim in selected_node.key_claims])
-                            st.session_state.chat_history.append({
-                                'role': 'system',
-                                'content': f"**Key Claims:**\n{claims_text}"
-                            })
-
-                        # Add theme tags if available
-                        if selected_node.theme_tags:
-                            tags_text = " ".join([f"#{tag}" for tag in sorted(selected_node.theme_tags)])
-                            st.session_state.chat_history.append({
-                                'role': 'system',
-                                'content': f"**Themes:** {tags_text}"
-                            })
+                        # Replace the chat with this node in one assignment
+                        st.session_state.chat_history = _hydrate_chat_from_node(selected_node, selected_node.node_id)
 
                         st.rerun()
 
                 with col2:
                     if st.button("🎯 Generate Continuation Question", use_container_width=True):
                         with st.spinner("Generating continuation strategy..."):
+                            from session import generate_continuation_strategy
+
                             strategy = generate_continuation_strategy(selected_node)
                             st.session_state.continuation_strategy = strategy
                             st.session_state.continuation_node_id = selected_node.node_id
@@ -628,18 +1140,12 @@ with tab1:
                         st.session_state.session = None
                         st.session_state.agents = None
                         st.session_state.agents_confirmed = False
-                        if 'debate_state' in st.session_state:
-                            del st.session_state.debate_state
-                        if 'pending_passage' in st.session_state:
-                            del st.session_state.pending_passage
-                        if 'auto_branch_done' in st.session_state:
-                            del st.session_state.auto_branch_done
+                        _pop_state('debate_state', 'pending_passage', 'auto_branch_done')
                         st.rerun()
 
                 # Show continuation strategy if generated
-                if (hasattr(st.session_state, 'continuation_strategy') and
-                    hasattr(st.session_state, 'continuation_node_id') and
-                    st.session_state.continuation_node_id == selected_node.node_id):
+                if ('continuation_strategy' in st.session_state and
+                    st.session_state.get('continuation_node_id') == selected_node.node_id):
 
                     strategy = st.session_state.continuation_strategy
 
@@ -667,10 +1173,7 @@ with tab1:
                         })
 
                         # Clear continuation state
-                        if hasattr(st.session_state, 'continuation_strategy'):
-                            delattr(st.session_state, 'continuation_strategy')
-                        if hasattr(st.session_state, 'continuation_node_id'):
-                            delattr(st.session_state, 'continuation_node_id')
+                        _pop_state('continuation_strategy', 'continuation_node_id')
 
                         # Start branch debate progressively
                         st.session_state.debate_state = {
@@ -704,11 +1207,16 @@ with tab1:
         state = st.session_state.debate_state
         agents = st.session_state.agents
 
+        # Round marker is transient: drawn each rerun, never stored in the chat
+        status_slot = st.empty()
+        if state['round'] <= state['max_rounds']:
+            status_slot.markdown(f"**Round {state['round']} of {state['max_rounds']}**")
+
         # Check if debate is complete
         if state['round'] > state['max_rounds']:
             # Finalize debate
-            from dialectic_poc import DebateTurn
-            from node_factory import NodeFactory
+            # Render the transcript once; shared by the summary and any observers
+            transcript_text = format_transcript(state['transcript'])
 
             # Create node - different for main vs branch
             with st.status("🧠 Analyzing debate and generating summary...", expanded=True) as status:
@@ -717,55 +1225,32 @@ with tab1:
                         node_type=NodeType.EXPLORATION,
                         transcript=state['transcript'],
                         passage=None,
-                        branch_question=state['branch_question']
+                        branch_question=state['branch_question'],
+                        transcript_text=transcript_text
                     )
                 else:
                     node = NodeFactory.create_node_from_transcript(
                         node_type=NodeType.EXPLORATION,
                         transcript=state['transcript'],
                         passage=state['passage'],
-                        branch_question=None
+                        branch_question=None,
+                        transcript_text=transcript_text
                     )
                 status.update(label="✅ Summary complete!", state="complete")
 
             # Add to DAG
-            st.session_state.session.dag.add_node(node)
-
-            # If branch, create edge to parent
-            if state['debate_type'] == 'branch' and state['parent_node_id']:
-                from debate_graph import Edge, EdgeType
-                edge = Edge(
-                    from_node_id=state['parent_node_id'],
-                    to_node_id=node.node_id,
-                    edge_type=EdgeType.BRANCHES_FROM,
-                    description=f"Branch: {state['branch_question'][:50]}..."
-                )
-                st.session_state.session.dag.add_edge(edge)
-
-            st.session_state.session.save()
+            if state['debate_type'] == 'main':
+                st.session_state.session.dag.add_node(node)
+                st.session_state.session.save()
+                # Rewriting a DAG doesn't touch output/'s mtime, so refresh the listing explicitly
+                _scan_sessions.clear()
+            else:
+                # Branch nodes are written together once the branch queue is done
+                add_branch_node(st.session_state.session, node, state['parent_node_id'], state['branch_question'])
             st.session_state.current_node = node
 
-            # Add completion message with annotations
-            st.session_state.chat_history.append({
-                'role': 'system',
-                'content': f"**Resolution ({node.node_type.value}):**\n\n{node.resolution}"
-            })
-
-            # Add key claims if available
-            if node.key_claims:
-                claims_text = "\n".join([f"• {claim}" for claim in node.key_claims])
-                st.session_state.chat_history.append({
-                    'role': 'system',
-                    'content': f"**Key Claims:**\n{claims_text}"
-                })
-
-            # Add theme tags if available
-            if node.theme_tags:
-                tags_text = " ".join([f"#{tag}" for tag in sorted(node.theme_tags)])
-                st.session_state.chat_history.append({
-                    'role': 'system',
-                    'content': f"**Themes:** {tags_text}"
-                })
+            # Add completion message with annotations (resolution, claims, themes)
+            st.session_state.chat_history.extend(node_summary_messages(node))
 
             # Different completion message for main vs branch
             if state['debate_type'] == 'branch':
@@ -779,6 +1264,15 @@ with tab1:
                     'content': f"✅ Main debate complete! **{node.topic}**"
                 })
 
+            # Nothing to branch from if the main debate produced no turns
+            if state['debate_type'] == 'main' and auto_branch and not node.turns_data:
+                st.session_state.auto_branch_done = True
+                st.warning("Main debate produced no transcript; skipping branch exploration.")
+                st.session_state.chat_history.append({
+                    'role': 'system',
+                    'content': "⚠️ Main debate produced no transcript; skipping branch exploration."
+                })
+
             # Check if auto-branching is enabled (only for main debates)
             if state['debate_type'] == 'main' and auto_branch and 'auto_branch_done' not in st.session_state:
                 st.session_state.auto_branch_done = True
@@ -790,11 +1284,7 @@ with tab1:
                 })
 
                 # Generate observers
-                observers_data = generate_observer_ensemble(
-                    state['passage'],
-                    num_perspectives=num_observers,
-                    verbose=False
-                )
+                observers_data = _cached_observer_ensemble(state['passage'], num_observers)
 
                 # Convert to Observer objects
                 observers = [
@@ -809,28 +1299,73 @@ with tab1:
                     for obs in observers_data
                 ]
 
-                # Generate all branch questions
-                transcript_text = "\n\n".join([
-                    f"**{turn.agent_name}** (Round {turn.round_num}):\n{turn.content}"
-                    for turn in state['transcript']
-                ])
-
-                branch_queue = []
-                for i, observer in enumerate(observers, 1):
-                    branch_question = observer.identify_branch(transcript_text, state['passage'])
-                    branch_queue.append({
-                        'question': branch_question,
-                        'observer_name': observer.name,
-                        'parent_node_id': node.node_id,
-                        'branch_num': i
-                    })
+                # Generate all branch questions from the transcript text rendered above
+                # One batched call, falling back to concurrent per-observer calls
+                branch_questions = asyncio.run(
+                    identify_branches(observers, transcript_text, state['passage'])
+                )
+
+                if parallel_branches:
+                    # Debate every branch at once, with the same turns as the progressive path
+                    branch_states = [
+                        {
+                            'debate_type': 'branch',
+                            'passage': None,
+                            'branch_question': branch_question,
+                            'parent_node_id': node.node_id,
+                            'round': 1,
+                            'agent_idx': 0,
+                            'transcript': [],
+                            'max_rounds': branch_rounds
+                        }
+                        for branch_question in branch_questions
+                    ]
+                    with st.status(f"🌿 Running {len(branch_questions)} branch debate(s) in parallel...", expanded=True) as status:
+                        branch_nodes = asyncio.run(parallel_branch_debates(
+                            branch_states, agents, parallel_within_round, parallel_later_rounds
+                        ))
+                        status.update(label="✅ Branch debates complete!", state="complete")
+
+                    agent_indices = {agent.name: i for i, agent in enumerate(agents)}
+                    for observer, branch_state, branch_node in zip(observers, branch_states, branch_nodes):
+                        add_branch_node(st.session_state.session, branch_node, node.node_id, branch_state['branch_question'])
+
+                        st.session_state.chat_history.append({
+                            'role': 'system',
+                            'content': f"🔍 **{observer.name}** asks: _{branch_state['branch_question']}_"
+                        })
+                        st.session_state.chat_history.extend(
+                            {
+                                'role': 'agent',
+                                'name': turn.agent_name,
+                                'content': turn.content,
+                                'round': turn.round_num,
+                                'avatar': agent_avatar(agent_indices[turn.agent_name])
+                            }
+                            for turn in branch_state['transcript']
+                        )
+                        st.session_state.chat_history.extend(node_summary_messages(branch_node))
+                        st.session_state.chat_history.append({
+                            'role': 'system',
+                            'content': f"✅ Branch debate complete! **{branch_node.topic}**"
+                        })
+                        st.session_state.current_node = branch_node
+                else:
+                    branch_queue = []
+                    for i, (observer, branch_question) in enumerate(zip(observers, branch_questions), 1):
+                        branch_queue.append({
+                            'question': branch_question,
+                            'observer_name': observer.name,
+                            'parent_node_id': node.node_id,
+                            'branch_num': i
+                        })
 
-                # Store branch queue
-                st.session_state.branch_queue = branch_queue
-                st.session_state.branch_queue_index = 0
+                    # Store branch queue
+                    st.session_state.branch_queue = branch_queue
+                    st.session_state.branch_queue_index = 0
 
             # Check if there are pending branches to run
-            if hasattr(st.session_state, 'branch_queue') and st.session_state.branch_queue_index < len(st.session_state.branch_queue):
+            if 'branch_queue' in st.session_state and st.session_state.branch_queue_index < len(st.session_state.branch_queue):
                 # Start next branch
                 branch_info = st.session_state.branch_queue[st.session_state.branch_queue_index]
                 st.session_state.branch_queue_index += 1
@@ -853,62 +1388,75 @@ with tab1:
                     'max_rounds': branch_rounds
                 }
                 st.session_state.debate_running = True
-                st.rerun()
+                _rerun_debate()
             else:
-                # All done - cleanup
+                # All done - write any branch nodes, then cleanup
+                if st.session_state.session.flush_if_dirty():
+                    _scan_sessions.clear()
                 st.session_state.debate_running = False
-                if 'debate_state' in st.session_state:
-                    del st.session_state.debate_state
-                if hasattr(st.session_state, 'branch_queue'):
-                    del st.session_state.branch_queue
-                    del st.session_state.branch_queue_index
+                _pop_state('debate_state', 'branch_queue', 'branch_queue_index')
 
                 st.rerun()
 
+        elif (state['agent_idx'] == 0 and len(agents) > 1 and
+              (parallel_within_round if state['round'] == 1 else parallel_later_rounds)):
+            # Whole round at once: every agent answers the same prompt concurrently
+            user_prompt = turn_prompt(state, agents)
+
+            with st.status(f"Round {state['round']}: {len(agents)} agents are thinking...", expanded=True):
+                responses = asyncio.run(round_responses(agents, debate_subject(state), user_prompt))
+
+            # Record in agent order so the transcript stays deterministic
+            for agent_idx, (agent, response) in enumerate(zip(agents, responses)):
+                response = response.strip()
+                recent_turn_lines(state, agents).append(f"{agent.name}: {response}")
+                state['transcript'].append(DebateTurn(agent.name, response, state['round']))
+                st.session_state.chat_history.append({
+                    'role': 'agent',
+                    'name': agent.name,
+                    'content': response,
+                    'round': state['round'],
+                    'avatar': agent_avatar(agent_idx)
+                })
+
+            # Advance straight to the next round
+            state['round'] += 1
+
+            _rerun_debate()
+
         else:
             # Generate next turn
             agent = agents[state['agent_idx']]
 
-            # Show status
-            with st.status(f"Round {state['round']}: {agent.name} is thinking...", expanded=True):
-                # Build prompts
-                system_prompt = agent.get_system_prompt()
-
-                if state['round'] == 1:
-                    # First round - different prompts for main vs branch debates
-                    if state['debate_type'] == 'branch':
-                        user_prompt = f"Question to explore:\n{state['branch_question']}\n\nProvide your opening analysis."
-                    else:
-                        user_prompt = f"Passage:\n{state['passage']}\n\nProvide your opening analysis."
-                else:
-                    from dialectic_poc import DebateTurn
-                    recent_turns = "\n\n".join([
-                        f"{t.agent_name}: {t.content}"
-                        for t in state['transcript'][-(len(agents)*2):]
-                    ])
-                    user_prompt = f"Previous discussion:\n{recent_turns}\n\nYour response:"
-
-                # Make LLM call with agent's specific model
-                from dialectic_poc import llm_call, DebateTurn
-                response = llm_call(
+            # Stream the turn into the agent's chat bubble as tokens arrive
+            with st.chat_message(agent.name, avatar=agent_avatar(state['agent_idx'])):
+                st.caption(f"Round {state['round']}: {agent.name}")
+
+                # Build prompts: stable per-agent prefix, turn-specific user message
+                system_prompt = debate_system_prompt(agent, debate_subject(state))
+
+                user_prompt = turn_prompt(state, agents)
+
+                # Make LLM call with agent's specific model, showing tokens as they arrive
+                response = st.write_stream(llm_call_stream(
                     system_prompt,
                     user_prompt,
                     temperature=0.7,
                     model=agent.model
-                )
+                )).strip()
 
                 # Create turn
                 turn = DebateTurn(agent.name, response, state['round'])
+                recent_turn_lines(state, agents).append(f"{turn.agent_name}: {turn.content}")
                 state['transcript'].append(turn)
 
                 # Add to chat history
-                avatar_map = {0: '📖', 1: '✨', 2: '🏛️', 3: '🎨', 4: '🔬'}
                 st.session_state.chat_history.append({
                     'role': 'agent',
                     'name': agent.name,
                     'content': response,
                     'round': state['round'],
-                    'avatar': avatar_map.get(state['agent_idx'], '🤔')
+                    'avatar': agent_avatar(state['agent_idx'])
                 })
 
             # Advance to next agent/round
@@ -916,168 +1464,118 @@ with tab1:
             if state['agent_idx'] >= len(agents):
                 state['agent_idx'] = 0
                 state['round'] += 1
-                # Add round marker for next round
-                if state['round'] <= state['max_rounds']:
-                    st.session_state.chat_history.append({
-                        'role': 'system',
-                        'content': f"**Round {state['round']}**"
-                    })
 
-            # Rerun to show turn and continue
-            st.rerun()
+            # Rerun the chat to show the turn and continue
+            _rerun_debate()
+
+with tab1:
+    _tab_debate()
 
 # TAB 2: Graph View
-with tab2:
+@st.fragment
+def _tab_graph():
     st.header("Debate Graph (DAG)")
 
-    if st.session_state.session and st.session_state.session.dag.nodes:
-        # Try to visualize graph
-        try:
-            import networkx as nx
-            import matplotlib.pyplot as plt
-            from io import BytesIO
-
-            # Create networkx graph
-            G = nx.DiGraph()
-
-            # Add nodes
-            for node_id, node in st.session_state.session.dag.nodes.items():
-                G.add_node(
-                    node_id,
-                    label=node.topic[:40] + "...",
-                    type=node.node_type.value
-                )
-
-            # Add edges
-            edge_colors = []
-            edge_labels = {}
-            for edge in st.session_state.session.dag.edges:
-                G.add_edge(edge.from_node_id, edge.to_node_id)
-                edge_labels[(edge.from_node_id, edge.to_node_id)] = edge.edge_type.value
-
-                # Color by type
-                if edge.edge_type == EdgeType.BRANCHES_FROM:
-                    edge_colors.append('blue')
-                elif edge.edge_type == EdgeType.CONTRADICTS:
-                    edge_colors.append('red')
-                else:
-                    edge_colors.append('green')
-
-            # Layout
-            pos = nx.spring_layout(G, k=2, iterations=50)
-
-            # Draw
-            fig, ax = plt.subplots(figsize=(12, 8))
-
-            # Node colors by type
-            node_colors = []
-            for node_id in G.nodes():
-                node = st.session_state.session.dag.get_node(node_id)
-                if node.node_type == NodeType.SYNTHESIS:
-                    node_colors.append('lightgreen')
-                elif node.node_type == NodeType.IMPASSE:
-                    node_colors.append('lightcoral')
-                elif node.node_type == NodeType.EXPLORATION:
-                    node_colors.append('lightblue')
-                else:
-                    node_colors.append('lightgray')
-
-            nx.draw_networkx_nodes(G, pos, node_color=node_colors, node_size=4000,
-                                  alpha=0.9, node_shape='s', ax=ax)  # Square nodes for text
-            nx.draw_networkx_edges(G, pos, edge_color=edge_colors, arrows=True,
-                                  arrowsize=20, width=2, alpha=0.6, ax=ax)
-
-            # Labels using concise summaries
-            labels = {}
-            all_nodes_list = list(st.session_state.session.dag.get_all_nodes())
-            for i, node_id in enumerate(G.nodes()):
-                node = st.session_state.session.dag.get_node(node_id)
-                # Use concise summary if available, otherwise truncate topic
-                if node.concise_summary:
-                    labels[node_id] = f"{i+1}.\n{node.concise_summary}"
-                else:
-                    labels[node_id] = f"{i+1}.\n{node.topic[:30]}..."
-
-            nx.draw_networkx_labels(G, pos, labels, font_size=8, font_weight='normal', ax=ax)
+    session = st.session_state.session
+    dag = session.dag if session else None
+    if not dag or not dag.nodes:
+        st.info("No graph yet. Create a session and run debates to build the graph.")
+        return
 
-            plt.axis('off')
-            plt.tight_layout()
+    # Try to visualize graph
+    try:
+        fingerprint = dag_fingerprint(session)
+        nodes_blob, edges_blob = _dag_blobs(dag, fingerprint)
 
-            st.pyplot(fig)
+        try:
+            fig = _render_dag_plotly(fingerprint, nodes_blob, edges_blob)
+            st.plotly_chart(fig, use_container_width=True)
+        except ImportError:
+            # No plotly: fall back to a static matplotlib render
+            png_bytes = _render_dag_png(fingerprint, nodes_blob, edges_blob)
+            st.image(png_bytes)
+
+        # Legend
+        st.markdown("""
+        **Node Colors:**
+        - 🟢 Green: Synthesis (agreement reached)
+        - 🔴 Red: Impasse (irreconcilable disagreement)
+        - 🔵 Blue: Exploration (open-ended investigation)
+
+        **Edge Colors:**
+        - Blue: Branches from
+        - Red: Contradicts
+        - Green: Elaborates
+        """)
+
+        # Node reference table
+        st.divider()
+        st.subheader("Node Reference")
+
+        # One element per node: the heading doubles as the expander label, and
+        # nodes without a summary are gathered into a single markdown block
+        plain_lines = []
+        for i, node in enumerate(dag.get_all_nodes(), 1):
+            emoji = NODE_EMOJI.get(node.node_type, "⚪")
+            heading = f"**{i}.** {emoji} [{node.node_type.value.upper()}] {node.topic}"
+
+            if not node.resolution:
+                plain_lines.append(heading)
+                continue
+
+            if plain_lines:
+                st.markdown("\n\n".join(plain_lines))
+                plain_lines = []
+            with st.expander(heading):
+                st.markdown(node.resolution)
+
+        if plain_lines:
+            st.markdown("\n\n".join(plain_lines))
+
+    except ImportError:
+        st.warning("Graph visualization requires networkx and matplotlib. Install with: `pip install networkx matplotlib`")
+
+        # Fallback: text representation
+        st.subheader("Nodes")
+        for i, node in enumerate(dag.get_all_nodes(), 1):
+            st.markdown(f"**{i}.** [{node.node_type.value}] {node.topic}")
+
+        st.subheader("Edges")
+        for edge in dag.edges:
+            from_node = dag.nodes[edge.from_node_id]
+            to_node = dag.nodes[edge.to_node_id]
+            st.markdown(f"- {from_node.topic[:30]}... **{edge.edge_type.value}** → {to_node.topic[:30]}...")
 
-            # Legend
-            st.markdown("""
-            **Node Colors:**
-            - 🟢 Green: Synthesis (agreement reached)
-            - 🔴 Red: Impasse (irreconcilable disagreement)
-            - 🔵 Blue: Exploration (open-ended investigation)
+with tab2:
+    _tab_graph()
 
-            **Edge Colors:**
-            - Blue: Branches from
-            - Red: Contradicts
-            - Green: Elaborates
-            """)
+# TAB 3: Narrative View
+@st.fragment
+def _tab_narrative():
+    st.header("Linearized Narrative")
 
-            # Node reference table
-            st.divider()
-            st.subheader("Node Reference")
-
-            all_nodes = st.session_state.session.dag.get_all_nodes()
-            for i, node in enumerate(all_nodes, 1):
-                # Emoji based on type
-                if node.node_type == NodeType.SYNTHESIS:
-                    emoji = "🟢"
-                elif node.node_type == NodeType.IMPASSE:
-                    emoji = "🔴"
-                elif node.node_type == NodeType.EXPLORATION:
-                    emoji = "🔵"
-                else:
-                    emoji = "⚪"
+    session = st.session_state.session
+    dag = session.dag if session else None
+    if not dag or not dag.nodes:
+        st.info("No narrative yet. Create a session and run debates first.")
+        return
 
-                st.markdown(f"**{i}.** {emoji} [{node.node_type.value.upper()}] {node.topic}")
+    # Generate narrative (re-rendered only when the DAG changes)
+    narrative = export_narrative_cached(session, dag_fingerprint(session))
 
-                # Show summary if available
-                if node.resolution:
-                    with st.expander(f"View summary for node {i}"):
-                        st.markdown(node.resolution)
+    # Display with markdown
+    st.markdown(narrative)
 
-        except ImportError:
-            st.warning("Graph visualization requires networkx and matplotlib. Install with: `pip install networkx matplotlib`")
-
-            # Fallback: text representation
-            st.subheader("Nodes")
-            for i, node in enumerate(st.session_state.session.dag.get_all_nodes(), 1):
-                st.markdown(f"**{i}.** [{node.node_type.value}] {node.topic}")
-
-            st.subheader("Edges")
-            for edge in st.session_state.session.dag.edges:
-                from_node = st.session_state.session.dag.get_node(edge.from_node_id)
-                to_node = st.session_state.session.dag.get_node(edge.to_node_id)
-                st.markdown(f"- {from_node.topic[:30]}... **{edge.edge_type.value}** → {to_node.topic[:30]}...")
-    else:
-        st.info("No graph yet. Create a session and run debates to build the graph.")
+    # Download button
+    st.download_button(
+        label="📥 Download Narrative",
+        data=narrative,
+        file_name=f"{session.session_name}_narrative.md",
+        mime="text/markdown"
+    )
 
-# TAB 3: Narrative View
 with tab3:
-    st.header("Linearized Narrative")
-
-    if st.session_state.session and st.session_state.session.dag.nodes:
-        # Generate narrative
-        with st.spinner("Generating narrative..."):
-            narrative = st.session_state.session.export_narrative()
-
-        # Display with markdown
-        st.markdown(narrative)
-
-        # Download button
-        st.download_button(
-            label="📥 Download Narrative",
-            data=narrative,
-            file_name=f"{st.session_state.session.session_name}_narrative.md",
-            mime="text/markdown"
-        )
-    else:
-        st.info("No narrative yet. Create a session and run debates first.")
+    _tab_narrative()
 
 # Footer
 st.sidebar.divider()
@@ -8,16 +8,26 @@ Phase 2: Agents encounter passage and form interpretations from their commitment
 This creates genuine philosophical disagreement rather than orchestrated diversity.
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import json
 import random
 
+# Optional faster parser; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from dialectic_poc import llm_call, Agent
+from dialectic_poc import llm_call, llm_call_async, extract_json, Agent
 from philosophical_traditions import (
     TRADITIONS,
     PhilosophicalTradition,
@@ -31,35 +41,10 @@ DEFAULT_MODELS = [
     "electronhub/gemini-2.5-flash"
 ]
 
-
-def initialize_philosophical_agent(
-    tradition: Optional[PhilosophicalTradition] = None,
-    model: str = "electronhub/claude-sonnet-4-5-20250929",
-    temperature: float = 0.95
-) -> Dict[str, any]:
-    """Phase 1: Initialize agent with independent commitments (passage-blind)
-
-    Creates a 'philosophical person' with genuine commitments, NOT optimized
-    for any particular passage.
-
-    Args:
-        tradition: Philosophical tradition to ground in, or None for wild card
-        model: LLM model to use for generation
-        temperature: High temp for genuine variety
-
-    Returns:
-        Agent profile dict with:
-        - name: Agent's name
-        - core_beliefs: Fundamental commitments
-        - intellectual_lineage: Who influenced them
-        - methodology: How they approach texts
-        - blindspots: What they systematically miss
-        - voice_style: How they argue
-        - tradition_name: Name of tradition (if any)
-        - model: Model that will be used for debate
-    """
-
-    system_prompt = """You are creating a philosophical agent with INDEPENDENT commitments.
+# System prompts are kept byte-identical across agents (no interpolation) so
+# providers can cache them as a shared prefix; everything that varies per
+# agent or passage goes in the user prompt.
+PHASE1_SYSTEM_PROMPT = """You are creating a philosophical agent with INDEPENDENT commitments.
 
 CRITICAL INSTRUCTIONS:
 1. You will NOT see the passage they'll debate. Don't optimize for any particular text.
@@ -101,8 +86,124 @@ OUTPUT FORMAT (strict JSON):
 
 OUTPUT ONLY THE JSON. NO MARKDOWN FORMATTING. NO EXPLANATORY TEXT."""
 
+PHASE2_SYSTEM_PROMPT = """You are a philosophical agent with the pre-existing commitments listed in the user message.
+
+You are encountering a passage for the FIRST TIME.
+
+CRITICAL INSTRUCTIONS:
+1. Interpret this passage FROM YOUR COMMITMENTS, not to create interesting debate
+2. You may have a boring or forced reading - that's authentic
+3. You may miss things others would find obvious - that's your blindspots
+4. Output MUST be valid JSON with exact structure below
+
+Given YOUR commitments, generate:
+1. Your immediate interpretation (what this passage means to YOU)
+2. What you'll focus on (what matters given your commitments)
+3. What you'll likely dispute (what you expect others to get wrong)
+
+OUTPUT FORMAT (strict JSON):
+{
+  "initial_reading": "Your first take on what this passage means (2-3 sentences)",
+  "focus_areas": "What you'll emphasize given your commitments (1-2 sentences)",
+  "likely_disputes": "Where you expect to disagree with others (1-2 sentences)"
+}
+
+OUTPUT ONLY THE JSON. NO MARKDOWN. NO EXTRA TEXT."""
+
+# Response schemas, for models that support structured output (see llm_call)
+AGENT_PROFILE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "core_beliefs": {"type": "string"},
+        "intellectual_lineage": {"type": "string"},
+        "methodology": {"type": "string"},
+        "blindspots": {"type": "array", "items": {"type": "string"}},
+        "voice_style": {"type": "string"}
+    },
+    "required": ["name", "core_beliefs", "intellectual_lineage", "methodology", "blindspots", "voice_style"]
+}
+
+ENCOUNTER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "initial_reading": {"type": "string"},
+        "focus_areas": {"type": "string"},
+        "likely_disputes": {"type": "string"}
+    },
+    "required": ["initial_reading", "focus_areas", "likely_disputes"]
+}
+
+# Phase 1 for several agents in one call: the same brief, applied to each
+PHASE1_BATCH_SYSTEM_PROMPT = (
+    "You are creating SEVERAL philosophical agents at once, one per AGENT section "
+    "in the request. Each is a different person: apply the brief below to each "
+    "of them separately.\n\n"
+    + PHASE1_SYSTEM_PROMPT.split("OUTPUT FORMAT (strict JSON):")[0]
+    + """OUTPUT FORMAT (strict JSON):
+{
+  "agents": [
+    {"name": "...", "core_beliefs": "...", "intellectual_lineage": "...", "methodology": "...", "blindspots": ["..."], "voice_style": "..."},
+    ...
+  ]
+}
+
+One object per AGENT section, in the order requested.
+OUTPUT ONLY THE JSON. NO MARKDOWN FORMATTING. NO EXPLANATORY TEXT."""
+)
+
+AGENT_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "agents": {"type": "array", "items": AGENT_PROFILE_SCHEMA}
+    },
+    "required": ["agents"]
+}
+
+
+# Phase 1 is passage-blind, so its responses can be reused across runs
+PROFILE_CACHE_DIR = Path.home() / ".cache" / "dialectic-poc" / "phase1"
+
+
+def _profile_cache_path(system_prompt: str, user_prompt: str, model: str, temperature: float) -> Path:
+    """Cache file for a Phase 1 call, keyed by everything that shapes the response"""
+    key = hashlib.sha256(
+        "\0".join((system_prompt, user_prompt, model, repr(temperature))).encode()
+    ).hexdigest()
+    return PROFILE_CACHE_DIR / f"{key}.json"
+
+
+def _read_cached_response(cache_path: Path) -> Optional[str]:
+    """Cached Phase 1 response, or None on a miss"""
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_cached_response(cache_path: Path, response: str) -> None:
+    """Store a Phase 1 response (atomically, so readers never see a partial file)"""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(response, encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def _json_loads(text: str):
+    """json.loads, via orjson when it's installed"""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _extract_json_object(text: str) -> str:
+    """Return the first balanced {...} object in an LLM response (see extract_json)"""
+    return extract_json(text, '{')
+
+
+def _tradition_brief(tradition: Optional[PhilosophicalTradition]) -> str:
+    """What to build for one Phase 1 agent: a tradition to ground in, or a wild card"""
+
     if tradition:
-        user_prompt = f"""Create a philosopher grounded in {tradition.name}.
+        return f"""Create a philosopher grounded in {tradition.name}.
 
 Core commitments of this tradition:
 {chr(10).join(f"- {c}" for c in tradition.core_commitments)}
@@ -113,48 +214,256 @@ Methodological principles:
 {chr(10).join(f"- {m}" for m in tradition.methodological_principles)}
 
 BUT: Make this a SPECIFIC person within that tradition, not a generic representative.
-Give them individual quirks, emphases, and preoccupations.
+Give them individual quirks, emphases, and preoccupations."""
 
-OUTPUT ONLY VALID JSON:"""
-    else:
-        user_prompt = """Create a philosopher with independent commitments.
+    return """Create a philosopher with independent commitments.
 
 They can draw on any tradition(s) or be genuinely original.
-Make them specific and distinctive.
+Make them specific and distinctive."""
 
-OUTPUT ONLY VALID JSON:"""
+
+def _agent_prompts(tradition: Optional[PhilosophicalTradition]) -> Tuple[str, str]:
+    """Build the Phase 1 (system_prompt, user_prompt) for a tradition"""
+
+    return PHASE1_SYSTEM_PROMPT, f"{_tradition_brief(tradition)}\n\nOUTPUT ONLY VALID JSON:"
+
+
+def _agent_batch_prompts(traditions: List[PhilosophicalTradition]) -> Tuple[str, str]:
+    """Build (system_prompt, user_prompt) asking for every Phase 1 agent in one call"""
+
+    briefs = "\n\n".join(
+        f"AGENT {i}:\n{_tradition_brief(tradition)}"
+        for i, tradition in enumerate(traditions, 1)
+    )
+
+    user_prompt = f"""{briefs}
+
+JSON object with {len(traditions)} agents:"""
+
+    return PHASE1_BATCH_SYSTEM_PROMPT, user_prompt
+
+
+def _parse_agent_profile(
+    response: str,
+    tradition: Optional[PhilosophicalTradition],
+    model: str
+) -> Dict[str, any]:
+    """Parse a Phase 1 response into an agent profile dict"""
+
+    # Parse JSON
+    try:
+        # The object itself, without markdown fences or surrounding text
+        agent_profile = _json_loads(_extract_json_object(response))
+
+        # Add metadata
+        agent_profile['tradition_name'] = tradition.name if tradition else "Independent"
+        agent_profile['model'] = model
+
+        return agent_profile
+
+    except json.JSONDecodeError as e:
+        print(f"JSON parse error: {e}")
+        print(f"Response was: {response}")
+        raise
+
+
+def initialize_philosophical_agent(
+    tradition: Optional[PhilosophicalTradition] = None,
+    model: str = "electronhub/claude-sonnet-4-5-20250929",
+    temperature: float = 0.95,
+    use_cache: bool = False
+) -> Dict[str, any]:
+    """Phase 1: Initialize agent with independent commitments (passage-blind)
+
+    Creates a 'philosophical person' with genuine commitments, NOT optimized
+    for any particular passage.
+
+    Args:
+        tradition: Philosophical tradition to ground in, or None for wild card
+        model: LLM model to use for generation
+        temperature: High temp for genuine variety
+        use_cache: Reuse the profile from an earlier identical call (same
+            tradition, model and temperature), stored under PROFILE_CACHE_DIR.
+            Off by default, since a fresh profile each run is the point of
+            the high temperature.
+
+    Returns:
+        Agent profile dict with:
+        - name: Agent's name
+        - core_beliefs: Fundamental commitments
+        - intellectual_lineage: Who influenced them
+        - methodology: How they approach texts
+        - blindspots: What they systematically miss
+        - voice_style: How they argue
+        - tradition_name: Name of tradition (if any)
+        - model: Model that will be used for debate
+    """
+
+    system_prompt, user_prompt = _agent_prompts(tradition)
+
+    cache_path = _profile_cache_path(system_prompt, user_prompt, model, temperature) if use_cache else None
+    response = _read_cached_response(cache_path) if cache_path else None
+    if response is not None:
+        return _parse_agent_profile(response, tradition, model)
 
     response = llm_call(
         system_prompt,
         user_prompt,
         temperature=temperature,
-        model=model
+        model=model,
+        schema=AGENT_PROFILE_SCHEMA
     )
 
-    # Parse JSON
-    try:
-        # Clean response of any markdown or extra text
-        response = response.strip()
+    agent_profile = _parse_agent_profile(response, tradition, model)
+    if cache_path:
+        _write_cached_response(cache_path, response)
+    return agent_profile
 
-        # Remove markdown code blocks if present
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0].strip()
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0].strip()
 
-        # Remove any text before first { or after last }
-        start = response.find('{')
-        end = response.rfind('}')
-        if start != -1 and end != -1:
-            response = response[start:end+1]
+async def ainitialize_philosophical_agent(
+    tradition: Optional[PhilosophicalTradition] = None,
+    model: str = "electronhub/claude-sonnet-4-5-20250929",
+    temperature: float = 0.95,
+    use_cache: bool = False
+) -> Dict[str, any]:
+    """Async variant of initialize_philosophical_agent, so agents can be initialized concurrently"""
 
-        agent_profile = json.loads(response)
+    system_prompt, user_prompt = _agent_prompts(tradition)
 
-        # Add metadata
+    cache_path = _profile_cache_path(system_prompt, user_prompt, model, temperature) if use_cache else None
+    response = _read_cached_response(cache_path) if cache_path else None
+    if response is not None:
+        return _parse_agent_profile(response, tradition, model)
+
+    response = await llm_call_async(
+        system_prompt,
+        user_prompt,
+        temperature=temperature,
+        model=model,
+        schema=AGENT_PROFILE_SCHEMA
+    )
+
+    agent_profile = _parse_agent_profile(response, tradition, model)
+    if cache_path:
+        _write_cached_response(cache_path, response)
+    return agent_profile
+
+
+def _parse_agent_batch(
+    response: str,
+    traditions: List[PhilosophicalTradition],
+    models: List[str]
+) -> List[Dict[str, any]]:
+    """Parse a batched Phase 1 response into one profile per tradition
+
+    Raises:
+        ValueError: If the response isn't an object with one complete agent
+            profile (every AGENT_PROFILE_SCHEMA field) per tradition
+            (json.JSONDecodeError is a ValueError too)
+    """
+    data = _json_loads(_extract_json_object(response))
+    agents = data.get('agents') if isinstance(data, dict) else None
+    required = AGENT_PROFILE_SCHEMA['required']
+    if (not isinstance(agents, list) or len(agents) != len(traditions)
+            or not all(isinstance(a, dict) and all(a.get(key) for key in required) for a in agents)):
+        raise ValueError(f"Expected {len(traditions)} complete agents in batched Phase 1 response")
+
+    for i, (agent_profile, tradition) in enumerate(zip(agents, traditions)):
         agent_profile['tradition_name'] = tradition.name if tradition else "Independent"
-        agent_profile['model'] = model
+        agent_profile['model'] = models[i % len(models)]
 
-        return agent_profile
+    return agents
+
+
+def initialize_philosophical_agents_batch(
+    traditions: List[PhilosophicalTradition],
+    model: str = "electronhub/claude-sonnet-4-5-20250929",
+    temperature: float = 0.95,
+    debate_models: Optional[List[str]] = None
+) -> List[Dict[str, any]]:
+    """Phase 1 for several agents with a single LLM call
+
+    Saves a round-trip (and a copy of the system prompt) per agent, but one
+    model writes every profile, so the profiles lose the variety of being
+    written by different models. The agents can still debate with different
+    models (debate_models).
+
+    Args:
+        traditions: One tradition per agent
+        model: LLM model that writes all the profiles
+        temperature: High temp for genuine variety
+        debate_models: Models the agents will use (cycled); defaults to model
+
+    Returns:
+        Agent profile dicts (see initialize_philosophical_agent), in tradition order
+
+    Raises:
+        ValueError: If the response can't be parsed (callers can fall back
+            to initialize_philosophical_agent per tradition)
+    """
+    system_prompt, user_prompt = _agent_batch_prompts(traditions)
+    response = llm_call(
+        system_prompt,
+        user_prompt,
+        temperature=temperature,
+        model=model,
+        schema=AGENT_BATCH_SCHEMA
+    )
+    return _parse_agent_batch(response, traditions, debate_models or [model])
+
+
+async def ainitialize_philosophical_agents_batch(
+    traditions: List[PhilosophicalTradition],
+    model: str = "electronhub/claude-sonnet-4-5-20250929",
+    temperature: float = 0.95,
+    debate_models: Optional[List[str]] = None
+) -> List[Dict[str, any]]:
+    """Async variant of initialize_philosophical_agents_batch"""
+    system_prompt, user_prompt = _agent_batch_prompts(traditions)
+    response = await llm_call_async(
+        system_prompt,
+        user_prompt,
+        temperature=temperature,
+        model=model,
+        schema=AGENT_BATCH_SCHEMA
+    )
+    return _parse_agent_batch(response, traditions, debate_models or [model])
+
+
+def _encounter_prompts(agent_profile: Dict[str, any], passage: str) -> Tuple[str, str]:
+    """Build the Phase 2 (system_prompt, user_prompt) for an agent and passage"""
+
+    system_prompt = PHASE2_SYSTEM_PROMPT
+
+    user_prompt = f"""Your pre-existing commitments:
+
+Core beliefs: {agent_profile['core_beliefs']}
+Intellectual lineage: {agent_profile['intellectual_lineage']}
+Methodology: {agent_profile['methodology']}
+Blindspots: {', '.join(agent_profile['blindspots'])}
+
+Passage:
+
+{passage}
+
+What is your reading, from YOUR philosophical commitments?
+
+OUTPUT ONLY VALID JSON:"""
+
+    return system_prompt, user_prompt
+
+
+def _parse_encounter(response: str, agent_profile: Dict[str, any]) -> Dict[str, any]:
+    """Parse a Phase 2 response and merge it into the agent's profile"""
+
+    # Parse JSON
+    try:
+        encounter_data = _json_loads(_extract_json_object(response))
+
+        # Merge with profile
+        enhanced_profile = {**agent_profile, **encounter_data}
+
+        return enhanced_profile
 
     except json.JSONDecodeError as e:
         print(f"JSON parse error: {e}")
@@ -184,84 +493,109 @@ def agent_encounters_passage(
         - likely_disputes: Where they expect disagreement
     """
 
-    system_prompt = f"""You are a philosophical agent with these pre-existing commitments:
-
-Core beliefs: {agent_profile['core_beliefs']}
-Intellectual lineage: {agent_profile['intellectual_lineage']}
-Methodology: {agent_profile['methodology']}
-Blindspots: {', '.join(agent_profile['blindspots'])}
-
-You are encountering a passage for the FIRST TIME.
+    system_prompt, user_prompt = _encounter_prompts(agent_profile, passage)
 
-CRITICAL INSTRUCTIONS:
-1. Interpret this passage FROM YOUR COMMITMENTS, not to create interesting debate
-2. You may have a boring or forced reading - that's authentic
-3. You may miss things others would find obvious - that's your blindspots
-4. Output MUST be valid JSON with exact structure below
-
-Given YOUR commitments, generate:
-1. Your immediate interpretation (what this passage means to YOU)
-2. What you'll focus on (what matters given your commitments)
-3. What you'll likely dispute (what you expect others to get wrong)
-
-OUTPUT FORMAT (strict JSON):
-{{
-  "initial_reading": "Your first take on what this passage means (2-3 sentences)",
-  "focus_areas": "What you'll emphasize given your commitments (1-2 sentences)",
-  "likely_disputes": "Where you expect to disagree with others (1-2 sentences)"
-}}
-
-OUTPUT ONLY THE JSON. NO MARKDOWN. NO EXTRA TEXT."""
+    response = llm_call(
+        system_prompt,
+        user_prompt,
+        temperature=temperature,
+        model=agent_profile['model'],
+        schema=ENCOUNTER_SCHEMA
+    )
 
-    user_prompt = f"""Passage:
+    return _parse_encounter(response, agent_profile)
 
-{passage}
 
-What is your reading, from YOUR philosophical commitments?
+async def aagent_encounters_passage(
+    agent_profile: Dict[str, any],
+    passage: str,
+    temperature: float = 0.7
+) -> Dict[str, any]:
+    """Async variant of agent_encounters_passage, so agents can read the passage concurrently"""
 
-OUTPUT ONLY VALID JSON:"""
+    system_prompt, user_prompt = _encounter_prompts(agent_profile, passage)
 
-    response = llm_call(
+    response = await llm_call_async(
         system_prompt,
         user_prompt,
         temperature=temperature,
-        model=agent_profile['model']
+        model=agent_profile['model'],
+        schema=ENCOUNTER_SCHEMA
     )
 
-    # Parse JSON
-    try:
-        # Clean response
-        response = response.strip()
+    return _parse_encounter(response, agent_profile)
 
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0].strip()
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0].strip()
 
-        start = response.find('{')
-        end = response.rfind('}')
-        if start != -1 and end != -1:
-            response = response[start:end+1]
+async def _generate_profiles(
+    traditions: List[PhilosophicalTradition],
+    passage: str,
+    models: List[str],
+    temperature: float,
+    max_concurrency: int,
+    cache_profiles: bool,
+    batch_init: bool,
+    verbose: bool
+) -> List[Dict[str, any]]:
+    """Run both phases for every agent; enhanced profiles come back in tradition order
+
+    Each agent is pipelined: its Phase 2 call starts as soon as its own
+    Phase 1 profile is back, rather than waiting for the slowest agent.
+    With batch_init, Phase 1 is a single call for all agents instead
+    (falling back to per-agent calls if its response can't be parsed).
+    """
 
-        encounter_data = json.loads(response)
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-        # Merge with profile
-        enhanced_profile = {**agent_profile, **encounter_data}
+    async def encounter(i: int, profile: Dict[str, any]):
+        if verbose:
+            print(f"  ✓ [{i+1}/{len(traditions)}] {profile['name']} encounters passage...")
+            print(f"    Beliefs: {profile['core_beliefs'][:100]}...")
+            print()
 
-        return enhanced_profile
+        async with semaphore:
+            enhanced_profile = await aagent_encounters_passage(profile, passage, temperature=0.7)
 
-    except json.JSONDecodeError as e:
-        print(f"JSON parse error: {e}")
-        print(f"Response was: {response}")
-        raise
+        if verbose:
+            print(f"  ✓ [{i+1}/{len(traditions)}] {enhanced_profile['name']}")
+            print(f"    Reading: {enhanced_profile['initial_reading'][:80]}...")
+            print()
 
+        return enhanced_profile
 
-def generate_agent_ensemble(
+    async def pipeline(i: int, tradition: PhilosophicalTradition):
+        async with semaphore:
+            profile = await ainitialize_philosophical_agent(
+                tradition=tradition,
+                model=models[i % len(models)],  # Cycle through models for diversity
+                temperature=temperature,
+                use_cache=cache_profiles
+            )
+        return await encounter(i, profile)
+
+    if batch_init and len(traditions) > 1:
+        try:
+            async with semaphore:
+                profiles = await ainitialize_philosophical_agents_batch(
+                    traditions, model=models[0], temperature=temperature, debate_models=models
+                )
+        except ValueError as e:
+            if verbose:
+                print(f"Batched agent initialization failed ({e}); initializing agents one at a time")
+        else:
+            return await asyncio.gather(*(encounter(i, p) for i, p in enumerate(profiles)))
+
+    return await asyncio.gather(*(pipeline(i, t) for i, t in enumerate(traditions)))
+
+
+async def agenerate_agent_ensemble(
     passage: str,
     num_agents: int = 3,
     temperature: float = 0.95,
     verbose: bool = True,
-    models: Optional[List[str]] = None
+    models: Optional[List[str]] = None,
+    max_concurrency: int = 4,
+    cache_profiles: bool = False,
+    batch_init: bool = False
 ) -> List[Agent]:
     """Generate ensemble of agents using two-phase initialization
 
@@ -274,6 +608,12 @@ def generate_agent_ensemble(
         temperature: Sampling temperature for Phase 1
         verbose: Print progress
         models: List of models to use (cycles through them)
+        max_concurrency: Maximum LLM calls in flight at once (provider rate limits)
+        cache_profiles: Reuse Phase 1 profiles from earlier runs (see
+            initialize_philosophical_agent); Phase 2 always runs fresh
+        batch_init: Write all Phase 1 profiles in one call with models[0]
+            (see initialize_philosophical_agents_batch); agents still
+            debate with the cycled models
 
     Returns:
         List of Agent objects ready to debate
@@ -287,49 +627,23 @@ def generate_agent_ensemble(
         print(f"TWO-PHASE AGENT GENERATION ({num_agents} agents)")
         print(f"{'='*80}\n")
 
-    # Phase 1: Initialize agents (passage-blind)
-    if verbose:
-        print("PHASE 1: Initializing philosophical agents (passage-blind)...")
-        print()
-
     # Select maximally incompatible traditions
     traditions = get_maximally_incompatible_traditions(num_agents)
 
-    agent_profiles = []
-    for i, tradition in enumerate(traditions):
-        # Cycle through models for diversity
-        model = models[i % len(models)]
-
-        if verbose:
-            print(f"[{i+1}/{num_agents}] Generating agent from {tradition.name} using {model.split('/')[-1]}...")
-
-        profile = initialize_philosophical_agent(
-            tradition=tradition,
-            model=model,
-            temperature=temperature
-        )
-
-        agent_profiles.append(profile)
-
-        if verbose:
-            print(f"  ✓ {profile['name']}")
-            print(f"    Beliefs: {profile['core_beliefs'][:100]}...")
-            print()
-
-    # Phase 2: Agents encounter passage
+    # Phase 1 (passage-blind) then Phase 2 (passage) for each agent, all agents at once
     if verbose:
-        print("\n" + "="*80)
-        print("PHASE 2: Agents encounter passage...")
-        print("="*80 + "\n")
+        print("PHASE 1 + 2: Initializing agents, each encountering the passage once ready...")
         print(f"Passage: {passage[:100]}...\n")
+        for i, tradition in enumerate(traditions):
+            print(f"[{i+1}/{num_agents}] Generating agent from {tradition.name} using {models[i % len(models)].split('/')[-1]}...")
+        print()
 
-    agents = []
-    for i, profile in enumerate(agent_profiles):
-        if verbose:
-            print(f"[{i+1}/{num_agents}] {profile['name']} encounters passage...")
-
-        enhanced_profile = agent_encounters_passage(profile, passage, temperature=0.7)
+    enhanced_profiles = await _generate_profiles(
+        traditions, passage, models, temperature, max_concurrency, cache_profiles, batch_init, verbose
+    )
 
+    agents = []
+    for enhanced_profile in enhanced_profiles:
         # Create Agent object
         agent = Agent(
             name=enhanced_profile['name'],
@@ -349,10 +663,6 @@ def generate_agent_ensemble(
 
         agents.append(agent)
 
-        if verbose:
-            print(f"  ✓ Reading: {enhanced_profile['initial_reading'][:80]}...")
-            print()
-
     if verbose:
         print("\n" + "="*80)
         print(f"✅ Generated {num_agents} agents with independent commitments!")
@@ -361,6 +671,43 @@ def generate_agent_ensemble(
     return agents
 
 
+def generate_agent_ensemble(
+    passage: str,
+    num_agents: int = 3,
+    temperature: float = 0.95,
+    verbose: bool = True,
+    models: Optional[List[str]] = None,
+    max_concurrency: int = 4,
+    cache_profiles: bool = False,
+    batch_init: bool = False
+) -> List[Agent]:
+    """Synchronous wrapper around agenerate_agent_ensemble (same arguments)
+
+    Safe to call from code that is already inside an event loop (notebooks,
+    async servers): the generation then runs on its own loop in a worker
+    thread. Async callers should await agenerate_agent_ensemble instead.
+    """
+
+    coro = agenerate_agent_ensemble(
+        passage,
+        num_agents=num_agents,
+        temperature=temperature,
+        verbose=verbose,
+        models=models,
+        max_concurrency=max_concurrency,
+        cache_profiles=cache_profiles,
+        batch_init=batch_init
+    )
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 if __name__ == "__main__":
     # Test with example passage
     test_passage = """the teeming chaos of willful being has knowable structure. humans, fully cast as limited animals, have a much maligned conception towards structure in the void, but we are not mistaken about the shape we feel in the dark. the facets at our fingers are partial images to blind men."""
@@ -14,6 +14,7 @@ from typing import List, Dict, Set, Optional
 from datetime import datetime
 from pathlib import Path
 import json
+import os
 import uuid
 
 
@@ -166,12 +167,18 @@ class DebateDAG:
             'created_at': datetime.now().isoformat(),
             'version': '0.4.0'  # Bumped for Phase 4
         }
+        # Bumped on every node/edge insertion; cheap cache key for rendered views
+        self.revision: int = 0
+        # Unique per in-memory graph (never saved), so two loads of the same
+        # file can't share cached views even at the same revision
+        self.instance_id: str = uuid.uuid4().hex
 
     def add_node(self, node: ArgumentNode) -> None:
         """Add a node to the graph"""
         if node.node_id in self.nodes:
             raise ValueError(f"Node {node.node_id} already exists in graph")
         self.nodes[node.node_id] = node
+        self.revision += 1
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the graph"""
@@ -190,6 +197,7 @@ class DebateDAG:
                 return
 
         self.edges.append(edge)
+        self.revision += 1
 
     def get_node(self, node_id: str) -> Optional[ArgumentNode]:
         """Get a node by ID"""
@@ -254,7 +262,11 @@ class DebateDAG:
         return [s for s in self.stubs if s.status == "superseded"]
 
     def save(self, path: Path) -> None:
-        """Save graph to JSON file (including stubs)"""
+        """Save graph to JSON file (including stubs)
+
+        Writes to a temp file and swaps it in with os.replace, so a crash
+        mid-write leaves the previous file intact.
+        """
         data = {
             'metadata': self.metadata,
             'nodes': [node.to_dict() for node in self.nodes.values()],
@@ -262,8 +274,10 @@ class DebateDAG:
             'stubs': [stub.to_dict() for stub in self.stubs]  # Phase 4 addition
         }
 
-        with open(path, 'w') as f:
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, 'w') as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
 
     @classmethod
     def load(cls, path: Path) -> 'DebateDAG':
@@ -271,6 +285,11 @@ class DebateDAG:
         with open(path, 'r') as f:
             data = json.load(f)
 
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DebateDAG':
+        """Build a graph from parsed save-file data (the format save writes)"""
         dag = cls()
         dag.metadata = data.get('metadata', {})
 
@@ -291,6 +310,9 @@ class DebateDAG:
                 stub = BranchStub.from_dict(stub_data)
                 dag.stubs.append(stub)
 
+        # Same revision as a graph built up to this state via add_node/add_edge
+        dag.revision = len(dag.nodes) + len(dag.edges)
+
         return dag
 
     def __repr__(self) -> str:
@@ -4,31 +4,63 @@ Phase 0: Proof of Core Mechanism
 Minimal branching debate system with hand-crafted agents
 """
 
+import asyncio
+import codecs
+import io
 import subprocess
 import json
-from typing import List, Dict, Optional
+import tempfile
+from typing import Dict, Iterator, List, Optional, Union
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 class Logger:
     """Handles logging to both console and file with LLM-powered summarization"""
-    def __init__(self, output_file: str):
+    def __init__(self, output_file: Optional[str]):
+        """
+        Args:
+            output_file: Path to write the log to, or None to keep it in
+                memory (see from_memory)
+        """
         self.output_file = output_file
         self.log_entries = []
         self.start_time = datetime.now()
 
-        # Create/clear the output file
-        with open(output_file, 'w') as f:
-            f.write(f"# Dialectical Debate Log\n")
-            f.write(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        header = f"# Dialectical Debate Log\nStarted: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+
+        if output_file is None:
+            self.buffer = io.StringIO()
+            self.buffer.write(header)
+        else:
+            self.buffer = None
+            # Create/clear the output file
+            with open(output_file, 'w') as f:
+                f.write(header)
+
+    @classmethod
+    def from_memory(cls) -> 'Logger':
+        """Create a logger that writes to an in-memory buffer instead of a file"""
+        return cls(None)
+
+    def getvalue(self) -> str:
+        """Return the log text written so far (in-memory loggers only)"""
+        return self.buffer.getvalue()
+
+    def save(self, path: Union[str, Path]):
+        """Write an in-memory log to disk in one go"""
+        Path(path).write_text(self.getvalue())
 
     def log(self, text: str, to_console: bool = True, to_file: bool = True):
         """Log text to console and/or file"""
         if to_console:
             print(text)
         if to_file:
-            with open(self.output_file, 'a') as f:
-                f.write(text + '\n')
+            if self.buffer is not None:
+                self.buffer.write(text + '\n')
+            else:
+                with open(self.output_file, 'a') as f:
+                    f.write(text + '\n')
         self.log_entries.append(text)
 
     def log_section(self, title: str):
@@ -83,7 +115,8 @@ One-sentence summary:"""
         self.log_section("SESSION COMPLETE")
         self.log(f"Ended: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         self.log(f"Duration: {duration.total_seconds():.1f} seconds")
-        self.log(f"\nOutput saved to: {self.output_file}")
+        if self.output_file is not None:
+            self.log(f"\nOutput saved to: {self.output_file}")
 
 class Agent:
     """Represents a debate participant with a specific perspective"""
@@ -102,6 +135,18 @@ class Agent:
         self.likely_disputes = None
         self.tradition_name = None
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization (includes extended fields)"""
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Agent':
+        """Create from dictionary produced by to_dict"""
+        agent = cls(data['name'], data['stance'], data['focus'], data['model'])
+        for field, value in data.items():
+            setattr(agent, field, value)
+        return agent
+
     def get_system_prompt(self) -> str:
         """Generate system prompt based on agent's philosophical identity
 
@@ -210,15 +255,50 @@ Look for:
 
     def identify_branch(
         self,
-        transcript: List['DebateTurn'],
+        transcript: Union[str, List['DebateTurn']],
         passage: str,
         temperature: float = 0.6
     ) -> str:
-        """Identify a branch point from this observer's biased perspective"""
+        """Identify a branch point from this observer's biased perspective
 
-        debate_text = "\n".join(str(t) for t in transcript)
+        Args:
+            transcript: Debate turns, or a transcript already rendered to text
+                (lets callers format once and share it across observers)
+            passage: Original passage being discussed
+            temperature: Sampling temperature
+        """
 
-        user_prompt = f"""Original passage:
+        return llm_call(
+            self.get_system_prompt(),
+            self._branch_prompt(transcript, passage),
+            temperature=temperature,
+            model="electronhub/claude-sonnet-4-5-20250929"  # Fallback to Sonnet (Haiku had issues)
+        )
+
+    async def aidentify_branch(
+        self,
+        transcript: Union[str, List['DebateTurn']],
+        passage: str,
+        temperature: float = 0.6
+    ) -> str:
+        """Async variant of identify_branch, so several observers can run concurrently"""
+
+        return await llm_call_async(
+            self.get_system_prompt(),
+            self._branch_prompt(transcript, passage),
+            temperature=temperature,
+            model="electronhub/claude-sonnet-4-5-20250929"  # Fallback to Sonnet (Haiku had issues)
+        )
+
+    def _branch_prompt(self, transcript: Union[str, List['DebateTurn']], passage: str) -> str:
+        """Build the identify_branch user prompt"""
+
+        if isinstance(transcript, str):
+            debate_text = transcript
+        else:
+            debate_text = "\n".join(str(t) for t in transcript)
+
+        return f"""Original passage:
 "{passage}"
 
 Debate transcript:
@@ -228,13 +308,6 @@ From YOUR perspective ({self.bias}), what is the single most important question
 
 Question:"""
 
-        return llm_call(
-            self.get_system_prompt(),
-            user_prompt,
-            temperature=temperature,
-            model="electronhub/claude-sonnet-4-5-20250929"  # Fallback to Sonnet (Haiku had issues)
-        )
-
     def check_for_tension(
         self,
         turn: 'DebateTurn',
@@ -406,20 +479,110 @@ class DebateTurn:
     def __str__(self):
         return f"**{self.agent_name}** (Round {self.round_num}):\n{self.content}\n"
 
+# Token budget for the "Previous discussion" excerpt in debate prompts
+RECENT_TURNS_TOKEN_BUDGET = 1500
+
+# User message for every debate turn after the opening round
+FOLLOWUP_PROMPT = "Previous discussion:\n{recent_turns}\n\nYour response:"
+
+@lru_cache(maxsize=None)
+def _tiktoken_encoding():
+    """Load the cl100k_base encoding on first use, or None if tiktoken isn't installed"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+@lru_cache(maxsize=1024)
+def count_tokens(text: str) -> int:
+    """Approximate token count of text
+
+    Exact for cl100k_base when tiktoken is installed, otherwise estimated
+    at ~4 characters per token. Cached, since the same recent turns are
+    counted again for every prompt they appear in.
+    """
+    encoding = _tiktoken_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+def trim_to_token_budget(lines, budget: int = RECENT_TURNS_TOKEN_BUDGET) -> List[str]:
+    """Keep the most recent lines that fit within a token budget
+
+    Walks from newest to oldest, so long turns push out older context
+    rather than overflowing the prompt. The newest line is always kept.
+
+    Args:
+        lines: Formatted turns, oldest first
+        budget: Maximum total tokens to keep
+
+    Returns:
+        The kept lines, oldest first
+    """
+    kept = []
+    used = 0
+    for line in reversed(lines):
+        used += count_tokens(line)
+        if kept and used > budget:
+            break
+        kept.append(line)
+    kept.reverse()
+    return kept
+
+@lru_cache(maxsize=None)
+def _llm_library():
+    """Import the llm library (same package as the CLI) on first use
+
+    Deferred because it loads every installed plugin. Returns None if it
+    isn't importable, in which case callers fall back to the CLI.
+    """
+    try:
+        import llm
+    except ImportError:
+        return None
+    return llm
+
+@lru_cache(maxsize=None)
+def get_llm_model(model: str):
+    """Resolve a model once per process and reuse it (and its HTTP client) across calls"""
+    return _llm_library().get_model(model)
+
 def llm_call(
     system_prompt: str,
     user_prompt: str,
     temperature: float = 0.7,
-    model: str = "electronhub/claude-sonnet-4-5-20250929"
+    model: str = "electronhub/claude-sonnet-4-5-20250929",
+    schema: Optional[dict] = None
 ) -> str:
-    """Call the llm CLI tool with model selection
+    """Call the llm tool with model selection
+
+    Uses the llm library in-process when importable, otherwise the llm CLI.
 
     Args:
         system_prompt: System prompt for the model
         user_prompt: User prompt/input
         temperature: Sampling temperature (0.0-1.0)
         model: Model ID (default: Sonnet 4.5)
+        schema: Optional JSON schema for the response. Models with structured
+            output support (via the llm library) are constrained to it; for
+            everything else it is ignored and the prompt has to ask for JSON.
     """
+    if _llm_library() is not None:
+        llm_model = get_llm_model(model)
+        extra = {}
+        if schema is not None and getattr(llm_model, 'supports_schema', False):
+            extra['schema'] = schema
+
+        # Same plugins and keys as the CLI, without a new process per call
+        response = llm_model.prompt(
+            user_prompt,
+            system=system_prompt,
+            temperature=temperature,
+            **extra
+        )
+        return response.text().strip()
+
     try:
         # Using llm with model, system prompt, and temperature
         result = subprocess.run(
@@ -435,6 +598,250 @@ def llm_call(
         print(f"stderr: {e.stderr}")
         raise
 
+def llm_call_stream(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    model: str = "electronhub/claude-sonnet-4-5-20250929"
+) -> Iterator[str]:
+    """Streaming variant of llm_call (same arguments)
+
+    Yields response text as it arrives instead of waiting for the whole
+    thing, so UIs can show partial output. Chunks are not stripped.
+    """
+    if _llm_library() is not None:
+        yield from get_llm_model(model).prompt(
+            user_prompt,
+            system=system_prompt,
+            temperature=temperature
+        )
+        return
+
+    # stderr goes to a temp file, so a chatty CLI can't block on a full pipe
+    # while we are only reading stdout
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            ['llm', '-m', model, '-s', system_prompt, '-o', 'temperature', str(temperature)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
+        )
+        finished = False
+        try:
+            process.stdin.write(user_prompt.encode())
+            process.stdin.close()
+
+            # The CLI streams tokens without waiting for newlines, so pass through
+            # whatever bytes are available (read1) rather than whole lines
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            while chunk := process.stdout.read1(4096):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            text = decoder.decode(b'', final=True)
+            if text:
+                yield text
+            finished = True
+        finally:
+            # If the consumer stopped early (e.g. a Streamlit rerun mid-stream)
+            # or reading failed, don't leave the CLI running; always reap it
+            if not finished:
+                process.kill()
+            process.wait()
+            process.stdout.close()
+
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            e = subprocess.CalledProcessError(
+                process.returncode, 'llm', stderr=stderr_file.read().decode(errors='replace')
+            )
+            print(f"Error calling llm: {e}")
+            print(f"stderr: {e.stderr}")
+            raise e
+
+async def llm_call_async(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.7,
+    model: str = "electronhub/claude-sonnet-4-5-20250929",
+    schema: Optional[dict] = None
+) -> str:
+    """Async variant of llm_call (same arguments)
+
+    Runs the llm CLI as an asyncio subprocess so independent calls can be
+    awaited together with asyncio.gather.
+    """
+    if _llm_library() is not None:
+        # In-process calls block, so give each its own worker thread
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, llm_call, system_prompt, user_prompt, temperature, model, schema
+        )
+
+    process = await asyncio.create_subprocess_exec(
+        'llm', '-m', model, '-s', system_prompt, '-o', 'temperature', str(temperature),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate(user_prompt.encode())
+
+    if process.returncode != 0:
+        e = subprocess.CalledProcessError(
+            process.returncode, 'llm', output=stdout.decode(), stderr=stderr.decode()
+        )
+        print(f"Error calling llm: {e}")
+        print(f"stderr: {e.stderr}")
+        raise e
+
+    return stdout.decode().strip()
+
+def _branch_batch_prompts(
+    observers: List['Observer'],
+    transcript: Union[str, List['DebateTurn']],
+    passage: str
+) -> tuple:
+    """Build (system_prompt, user_prompt) asking all observers for branches in one call"""
+
+    system_prompt = f"""You speak for {len(observers)} observers of the same philosophical debate, each with its own perspective (profiles below).
+
+For EACH observer, identify the single most important question the debaters are NOT asking, as that observer would see it. Questions should differ - each comes from a different bias.
+
+OUTPUT FORMAT (strict JSON):
+["question from observer 1", "question from observer 2", ...]
+
+Exactly {len(observers)} questions, in the order the observers are listed.
+OUTPUT ONLY THE JSON ARRAY. NO MARKDOWN. NO EXTRA TEXT."""
+
+    profiles = "\n\n".join(
+        f"""OBSERVER {i}: {observer.name}
+Core bias: {observer.bias}
+Focus: {observer.focus}
+Systematically overlooks: {', '.join(observer.blind_spots)}"""
+        for i, observer in enumerate(observers, 1)
+    )
+
+    if isinstance(transcript, str):
+        debate_text = transcript
+    else:
+        debate_text = "\n".join(str(t) for t in transcript)
+
+    user_prompt = f"""Original passage:
+"{passage}"
+
+Debate transcript:
+{debate_text}
+
+{profiles}
+
+JSON array of {len(observers)} questions:"""
+
+    return system_prompt, user_prompt
+
+def extract_json(text: str, opener: str = '{', start: int = 0) -> str:
+    """Return the first balanced JSON object ('{') or array ('[') in an LLM response
+
+    One pass over the text from `start`, tracking nesting depth and whether
+    we're inside a JSON string (honouring backslash escapes), so brackets in
+    string values and anything after the value (closing fences, trailing
+    prose) are ignored. If the value never closes, the text from its opener
+    is returned for json.loads to report on; if there is no opener at all,
+    the text is returned unchanged.
+    """
+    closer = '}' if opener == '{' else ']'
+    start = text.find(opener, start)
+    if start == -1:
+        return text
+
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == opener:
+            depth += 1
+        elif char == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start:i+1]
+
+    return text[start:]
+
+def _parse_branch_batch(response: str, expected: int) -> List[str]:
+    """Parse the JSON array returned for a batched branch request
+
+    Tries each '[' in turn, so a bracketed aside in prose before the
+    array (e.g. "[note]") doesn't hide the array itself.
+
+    Raises:
+        ValueError: If the response has no JSON array of `expected` strings
+    """
+    start = response.find('[')
+    while start != -1:
+        try:
+            questions = json.loads(extract_json(response, '[', start))
+        except json.JSONDecodeError:
+            questions = None
+
+        if (isinstance(questions, list) and len(questions) == expected
+                and all(isinstance(q, str) and q.strip() for q in questions)):
+            return [q.strip() for q in questions]
+
+        start = response.find('[', start + 1)
+
+    raise ValueError(f"Expected a JSON array of {expected} questions in batched branch response")
+
+def identify_branches_batch(
+    observers: List['Observer'],
+    transcript: Union[str, List['DebateTurn']],
+    passage: str,
+    temperature: float = 0.6
+) -> List[str]:
+    """Identify one branch question per observer with a single LLM call
+
+    Shares the passage and transcript tokens across all observers instead
+    of sending them once per observer.
+
+    Returns:
+        Questions in the same order as observers
+
+    Raises:
+        ValueError: If the response can't be parsed (callers can fall back
+            to Observer.identify_branch per observer)
+    """
+    system_prompt, user_prompt = _branch_batch_prompts(observers, transcript, passage)
+    response = llm_call(
+        system_prompt,
+        user_prompt,
+        temperature=temperature,
+        model="electronhub/claude-sonnet-4-5-20250929"
+    )
+    return _parse_branch_batch(response, len(observers))
+
+async def aidentify_branches_batch(
+    observers: List['Observer'],
+    transcript: Union[str, List['DebateTurn']],
+    passage: str,
+    temperature: float = 0.6
+) -> List[str]:
+    """Async variant of identify_branches_batch"""
+    system_prompt, user_prompt = _branch_batch_prompts(observers, transcript, passage)
+    response = await llm_call_async(
+        system_prompt,
+        user_prompt,
+        temperature=temperature,
+        model="electronhub/claude-sonnet-4-5-20250929"
+    )
+    return _parse_branch_batch(response, len(observers))
+
 def summarize_debate_phase(transcript: List[DebateTurn], phase_name: str) -> str:
     """Generate a summary of what happened in a debate phase"""
     debate_text = "\n".join(f"{t.agent_name}: {t.content}" for t in transcript)
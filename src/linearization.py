@@ -9,13 +9,13 @@ Strategy: Topological sort with chronological fallback
 
 import sys
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import List, Set, Dict, Optional
 from collections import deque
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from debate_graph import DebateDAG, ArgumentNode, EdgeType
+from debate_graph import DebateDAG, ArgumentNode, Edge, EdgeType
 
 
 class LinearizationEngine:
@@ -136,10 +136,20 @@ class LinearizationEngine:
         sections.append(self._render_toc(node_order))
         sections.append("")
 
+        # Index edges by endpoint once, rather than scanning every edge per node
+        incoming = {node_id: [] for node_id in self.dag.nodes}
+        outgoing = {node_id: [] for node_id in self.dag.nodes}
+        for edge in self.dag.edges:
+            incoming[edge.to_node_id].append(edge)
+            outgoing[edge.from_node_id].append(edge)
+
         # Nodes
+        nodes = self.dag.nodes
         for i, node_id in enumerate(node_order, 1):
-            node = self.dag.get_node(node_id)
-            sections.append(self._render_node(node, number=i))
+            sections.append(self._render_node(
+                nodes[node_id], number=i,
+                incoming=incoming[node_id], outgoing=outgoing[node_id]
+            ))
             sections.append("")
 
         markdown = "\n".join(sections)
@@ -173,8 +183,9 @@ class LinearizationEngine:
             ""
         ]
 
+        nodes = self.dag.nodes
         for i, node_id in enumerate(node_order, 1):
-            node = self.dag.get_node(node_id)
+            node = nodes[node_id]
             # Create anchor link
             anchor = f"node-{i}"
             lines.append(f"{i}. [{node.topic[:80]}](##{anchor})")
@@ -184,8 +195,16 @@ class LinearizationEngine:
 
         return "\n".join(lines)
 
-    def _render_node(self, node: ArgumentNode, number: int) -> str:
-        """Render a single node"""
+    def _render_node(self,
+                     node: ArgumentNode,
+                     number: int,
+                     incoming: Optional[List[Edge]] = None,
+                     outgoing: Optional[List[Edge]] = None) -> str:
+        """Render a single node
+
+        incoming/outgoing may be passed in when the caller has already
+        indexed the edges; otherwise they're looked up on the DAG.
+        """
 
         lines = []
 
@@ -202,16 +221,19 @@ class LinearizationEngine:
             lines.append(f"**Tags:** {tags}")
 
         # Show edges
-        incoming = self.dag.get_incoming_edges(node.node_id)
-        outgoing = self.dag.get_outgoing_edges(node.node_id)
+        if incoming is None:
+            incoming = self.dag.get_incoming_edges(node.node_id)
+        if outgoing is None:
+            outgoing = self.dag.get_outgoing_edges(node.node_id)
 
         if incoming or outgoing:
+            nodes = self.dag.nodes
             edge_strs = []
             for edge in incoming:
-                from_node = self.dag.get_node(edge.from_node_id)
+                from_node = nodes[edge.from_node_id]
                 edge_strs.append(f"← {edge.edge_type.value} from '{from_node.topic[:40]}...'")
             for edge in outgoing:
-                to_node = self.dag.get_node(edge.to_node_id)
+                to_node = nodes[edge.to_node_id]
                 edge_strs.append(f"→ {edge.edge_type.value} to '{to_node.topic[:40]}...'")
 
             lines.append(f"**Edges:** {', '.join(edge_strs)}")
@@ -92,6 +92,9 @@ def run_multi_observer_debate(
 
     observer_results = []
 
+    # Render the main transcript once (same text identify_branch would build per observer)
+    main_transcript_text = "\n".join(str(turn) for turn in main_transcript)
+
     for i, observer in enumerate(observers, 1):
         print(f"\n{'-'*80}")
         print(f"OBSERVER {i}/{len(observers)}: {observer.name}")
@@ -100,7 +103,7 @@ def run_multi_observer_debate(
 
         # Identify branch
         print(f"Identifying branch point...")
-        branch_question = observer.identify_branch(main_transcript, passage)
+        branch_question = observer.identify_branch(main_transcript_text, passage)
         print(f"✓ Branch identified:\n  {branch_question}\n")
 
         # Run branch debate
@@ -17,6 +17,14 @@ from typing import List, Tuple, Optional, Set
 import re
 
 
+def format_transcript(transcript: List[DebateTurn]) -> str:
+    """Render a transcript as markdown text for summarization prompts"""
+    return "\n\n".join(
+        f"**{turn.agent_name}** (Round {turn.round_num}):\n{turn.content}"
+        for turn in transcript
+    )
+
+
 class NodeCreationDetector:
     """Detects when a debate reaches semantic completion"""
 
@@ -149,7 +157,8 @@ class NodeFactory:
         node_type: NodeType,
         transcript: List[DebateTurn],
         passage: Optional[str] = None,
-        branch_question: Optional[str] = None
+        branch_question: Optional[str] = None,
+        transcript_text: Optional[str] = None
     ) -> ArgumentNode:
         """
         Create an ArgumentNode from a debate transcript
@@ -159,13 +168,14 @@ class NodeFactory:
         - resolution (paragraph summary)
         - theme_tags (key concepts)
         - key_claims (main assertions)
+
+        transcript_text may be passed in if the caller already rendered the
+        transcript (see format_transcript), to avoid building it twice.
         """
 
         # Convert transcript to text
-        transcript_text = "\n\n".join([
-            f"**{turn.agent_name}** (Round {turn.round_num}):\n{turn.content}"
-            for turn in transcript
-        ])
+        if transcript_text is None:
+            transcript_text = format_transcript(transcript)
 
         # Generate topic (1-2 sentences)
         topic = NodeFactory._generate_topic(transcript_text, passage, branch_question)
@@ -11,15 +11,21 @@ Integrates all Phase 3 components:
 Provides high-level interface for graph-building debates.
 """
 
+import asyncio
 import sys
+import uuid
+from collections import Counter
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from dialectic_poc import Agent, DebateTurn, Logger, llm_call
+from dialectic_poc import (
+    Agent, DebateTurn, Logger, FOLLOWUP_PROMPT,
+    llm_call, llm_call_async, trim_to_token_budget
+)
 from debate_graph import DebateDAG, ArgumentNode, NodeType, Edge, EdgeType
 from node_factory import NodeCreationDetector, NodeFactory
 from context_retrieval import ContextRetriever
@@ -215,13 +221,22 @@ class DebateSession:
     - Narrative export
     """
 
-    def __init__(self, session_name: str, load_existing: bool = False):
+    def __init__(self,
+                 session_name: str,
+                 load_existing: bool = False,
+                 autosave: bool = True,
+                 dag: Optional[DebateDAG] = None):
         """
         Initialize debate session
 
         Args:
             session_name: Name for this session (used for file paths)
             load_existing: If True, load existing DAG from disk
+            autosave: If True, process_passage/process_branch write the DAG
+                as soon as they add a node. If False they only mark it dirty,
+                and the caller batches writes with flush_if_dirty().
+            dag: Already-loaded DAG to use (e.g. from DebateDAG.from_dict);
+                takes precedence over load_existing
         """
 
         self.session_name = session_name
@@ -231,7 +246,9 @@ class DebateSession:
         self.dag_path = self.session_dir / f"{session_name}_dag.json"
 
         # Initialize or load DAG
-        if load_existing and self.dag_path.exists():
+        if dag is not None:
+            self.dag = dag
+        elif load_existing and self.dag_path.exists():
             print(f"Loading existing DAG from {self.dag_path}")
             self.dag = DebateDAG.load(self.dag_path)
         else:
@@ -247,11 +264,22 @@ class DebateSession:
         # Track current main node (for branch detection)
         self.current_main_node: Optional[ArgumentNode] = None
 
+        self.autosave = autosave
+
+        # DAG has changes not yet written to disk (see flush_if_dirty)
+        self.dirty = False
+
+    @property
+    def dag_version(self) -> int:
+        """Revision counter of the session DAG (bumps on every node/edge insertion)"""
+        return self.dag.revision
+
     def process_passage(self,
                        passage: str,
                        agents: List[Agent],
                        logger: Logger,
-                       max_rounds: int = 3) -> ArgumentNode:
+                       max_rounds: int = 3,
+                       on_turn: Optional[Callable[[DebateTurn], None]] = None) -> ArgumentNode:
         """
         Process a passage with context-enhanced debate
 
@@ -260,6 +288,7 @@ class DebateSession:
             agents: List of Agent objects
             logger: Logger for output
             max_rounds: Maximum debate rounds
+            on_turn: Optional callback invoked with each DebateTurn as it completes
 
         Returns:
             The created ArgumentNode
@@ -283,7 +312,8 @@ class DebateSession:
             agents=agents,
             logger=logger,
             context=context_text,
-            max_rounds=max_rounds
+            max_rounds=max_rounds,
+            on_turn=on_turn
         )
 
         # 3. Create node from transcript
@@ -313,8 +343,8 @@ class DebateSession:
             for edge in new_edges:
                 logger.log(f"  {edge.edge_type.value}: {edge.description}")
 
-        # 6. Save DAG
-        self.save()
+        # 6. Save DAG (or leave it for the caller's flush_if_dirty)
+        self._record_change()
 
         # Update current main node
         self.current_main_node = node
@@ -326,7 +356,8 @@ class DebateSession:
                       parent_node_id: str,
                       agents: List[Agent],
                       logger: Logger,
-                      max_rounds: int = 3) -> ArgumentNode:
+                      max_rounds: int = 3,
+                      on_turn: Optional[Callable[[DebateTurn], None]] = None) -> ArgumentNode:
         """
         Process a branch debate
 
@@ -336,11 +367,105 @@ class DebateSession:
             agents: List of Agent objects
             logger: Logger for output
             max_rounds: Maximum debate rounds
+            on_turn: Optional callback invoked with each DebateTurn as it completes
 
         Returns:
             The created ArgumentNode (branch)
         """
 
+        parent_node, context_text = self._prepare_branch(branch_question, parent_node_id, logger)
+
+        node = self._run_branch_debate(
+            branch_question, agents, logger, context_text, max_rounds, on_turn
+        )
+
+        return self._attach_branch_node(node, branch_question, parent_node, logger)
+
+    async def aprocess_branch(self,
+                              branch_question: str,
+                              parent_node_id: str,
+                              agents: List[Agent],
+                              logger: Logger,
+                              max_rounds: int = 3,
+                              semaphore: Optional[asyncio.Semaphore] = None) -> ArgumentNode:
+        """
+        Async variant of process_branch, for running several branches at once
+
+        The debate and summary (all LLM calls) run in a worker thread, with
+        the semaphore bounding how many run at a time. Context retrieval and
+        DAG updates stay on the event loop thread, so concurrent branches
+        never read or mutate the DAG at the same time.
+
+        Args:
+            semaphore: Optional limit shared by concurrently running branches
+
+        Returns:
+            The created ArgumentNode (branch)
+        """
+        parent_node, context_text = self._prepare_branch(branch_question, parent_node_id, logger)
+
+        loop = asyncio.get_running_loop()
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(1)
+        async with semaphore:
+            node = await loop.run_in_executor(
+                None,
+                self._run_branch_debate,
+                branch_question, agents, logger, context_text, max_rounds, None
+            )
+
+        return self._attach_branch_node(node, branch_question, parent_node, logger)
+
+    def process_branches(self,
+                         branch_questions: List[str],
+                         parent_node_id: str,
+                         agents: List[Agent],
+                         loggers: Optional[List[Logger]] = None,
+                         max_rounds: int = 3,
+                         max_concurrency: int = 2) -> List[ArgumentNode]:
+        """
+        Run several branch debates off the same parent concurrently
+
+        Each branch is an independent debate, so total time is roughly that
+        of the slowest batch rather than the sum of all branches.
+
+        Args:
+            branch_questions: Questions to explore, one branch each
+            parent_node_id: ID of the parent node they all branch from
+            agents: List of Agent objects (shared, read-only)
+            loggers: One Logger per branch (default: in-memory loggers, so
+                concurrent branches don't interleave in one log)
+            max_rounds: Maximum debate rounds per branch
+            max_concurrency: Maximum branch debates in flight at once
+
+        Returns:
+            Branch nodes in the same order as branch_questions
+        """
+        if loggers is None:
+            loggers = [Logger.from_memory() for _ in branch_questions]
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(max_concurrency)
+            return await asyncio.gather(*(
+                self.aprocess_branch(
+                    question, parent_node_id, agents, logger,
+                    max_rounds=max_rounds, semaphore=semaphore
+                )
+                for question, logger in zip(branch_questions, loggers)
+            ))
+
+        return asyncio.run(run_all())
+
+    def _prepare_branch(self,
+                        branch_question: str,
+                        parent_node_id: str,
+                        logger: Logger):
+        """
+        Look up the parent node and build the branch debate context
+
+        Returns:
+            (parent_node, context_text)
+        """
         logger.log_section(f"BRANCH DEBATE: {branch_question}")
 
         # Verify parent exists
@@ -355,6 +480,21 @@ class DebateSession:
         logger.log_subsection("Parent Node")
         logger.log(parent_node.topic)
 
+        return parent_node, context_text
+
+    def _run_branch_debate(self,
+                           branch_question: str,
+                           agents: List[Agent],
+                           logger: Logger,
+                           context_text: str,
+                           max_rounds: int,
+                           on_turn: Optional[Callable[[DebateTurn], None]]) -> ArgumentNode:
+        """
+        Debate a branch question and summarize it into a node (not yet in the DAG)
+
+        Only makes LLM calls and doesn't touch the DAG, so it's safe to run
+        in a worker thread.
+        """
         # 2. Run branch debate
         transcript = self._run_debate_with_context(
             passage=branch_question,
@@ -362,7 +502,8 @@ class DebateSession:
             logger=logger,
             context=context_text,
             max_rounds=max_rounds,
-            is_branch=True
+            is_branch=True,
+            on_turn=on_turn
         )
 
         # 3. Detect completion and classify
@@ -378,19 +519,30 @@ class DebateSession:
         logger.log(f"Detected type: {node_type.value}")
 
         # 4. Create node
-        node = NodeFactory.create_node_from_transcript(
+        return NodeFactory.create_node_from_transcript(
             node_type=node_type,
             transcript=transcript,
             passage=None,
             branch_question=branch_question
         )
 
+    def _attach_branch_node(self,
+                            node: ArgumentNode,
+                            branch_question: str,
+                            parent_node: ArgumentNode,
+                            logger: Logger) -> ArgumentNode:
+        """
+        Add a finished branch node to the DAG with its BRANCHES_FROM edge
+
+        Returns:
+            The node
+        """
         # 5. Add to DAG
         self.dag.add_node(node)
 
         # 6. Create BRANCHES_FROM edge (automatic, high confidence)
         branch_edge = Edge(
-            from_node_id=parent_node_id,
+            from_node_id=parent_node.node_id,
             to_node_id=node.node_id,
             edge_type=EdgeType.BRANCHES_FROM,
             description=f"Branch: {branch_question[:100]}",
@@ -406,14 +558,57 @@ class DebateSession:
         for edge in other_edges:
             self.dag.add_edge(edge)
 
-        # 8. Save DAG
-        self.save()
+        # 8. Save DAG (or leave it for the caller's flush_if_dirty)
+        self._record_change()
 
         return node
 
     def save(self):
         """Save DAG to disk"""
         self.dag.save(self.dag_path)
+        self.dirty = False
+
+    def mark_dirty(self):
+        """Record that the DAG changed without writing it yet"""
+        self.dirty = True
+
+    def _record_change(self):
+        """Save the DAG now if autosaving, otherwise mark it dirty"""
+        if self.autosave:
+            self.save()
+        else:
+            self.mark_dirty()
+
+    def flush_if_dirty(self) -> bool:
+        """
+        Save the DAG if it has unsaved changes
+
+        With autosave=False, lets several node additions (e.g. a run of
+        branch debates) share one write instead of serializing the whole
+        DAG after each.
+
+        Returns:
+            True if the DAG was written
+        """
+        if not self.dirty:
+            return False
+        self.save()
+        return True
+
+    def new_log_path(self, prefix: str = "debate") -> Path:
+        """
+        Get a fresh path for a debate log inside this session's directory
+
+        Keeps logs next to the DAG instead of scattering temp files.
+
+        Args:
+            prefix: Filename prefix
+
+        Returns:
+            Path like output/<session>/<prefix>_<8 hex chars>.md
+        """
+
+        return self.session_dir / f"{prefix}_{uuid.uuid4().hex[:8]}.md"
 
     def export_summary(self, output_path: Optional[Path] = None) -> str:
         """
@@ -456,7 +651,8 @@ class DebateSession:
                                  logger: Logger,
                                  context: str,
                                  max_rounds: int,
-                                 is_branch: bool = False) -> List[DebateTurn]:
+                                 is_branch: bool = False,
+                                 on_turn: Optional[Callable[[DebateTurn], None]] = None) -> List[DebateTurn]:
         """
         Run debate with context injected into agent prompts
 
@@ -467,6 +663,7 @@ class DebateSession:
             context: Formatted context from past debates
             max_rounds: Maximum rounds
             is_branch: Whether this is a branch debate
+            on_turn: Optional callback invoked with each DebateTurn as it completes
 
         Returns:
             List of DebateTurns
@@ -477,39 +674,38 @@ class DebateSession:
         for round_num in range(1, max_rounds + 1):
             logger.log_subsection(f"Round {round_num}")
 
-            for agent in agents:
-                # Build system prompt with context
-                system_prompt = agent.get_system_prompt()
-
-                if context:
-                    system_prompt += f"\n\n{context}\n\nUse this context to inform your arguments where relevant. You may reference previous discussions."
+            # Opening statements don't depend on each other, so request them all at once
+            if round_num == 1:
+                openings = asyncio.run(self._opening_statements(agents, passage, context, is_branch))
 
-                # Build user prompt
+            for agent_idx, agent in enumerate(agents):
                 if round_num == 1:
-                    if is_branch:
-                        user_prompt = f"Question to explore: {passage}\n\nProvide your perspective."
-                    else:
-                        user_prompt = f"Passage:\n{passage}\n\nProvide your opening analysis."
+                    response = openings[agent_idx]
                 else:
-                    # Include recent turns
-                    recent_turns = "\n\n".join([
+                    # Include recent turns: last 2 rounds, trimmed further if
+                    # they exceed the token budget
+                    recent_turns = "\n\n".join(trim_to_token_budget([
                         f"{t.agent_name}: {t.content}"
-                        for t in transcript[-(len(agents)*2):]  # Last 2 rounds
-                    ])
-                    user_prompt = f"Previous discussion:\n{recent_turns}\n\nYour response:"
-
-                # Get response from LLM
-                response = llm_call(
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    temperature=0.7,
-                    model="electronhub/claude-sonnet-4-5-20250929"
-                )
+                        for t in transcript[-(len(agents)*2):]
+                    ]))
+                    user_prompt = FOLLOWUP_PROMPT.format(recent_turns=recent_turns)
+
+                    # Get response from LLM
+                    response = llm_call(
+                        system_prompt=self._system_prompt_with_context(agent, context),
+                        user_prompt=user_prompt,
+                        temperature=0.7,
+                        model="electronhub/claude-sonnet-4-5-20250929"
+                    )
 
                 # Create turn
                 turn = DebateTurn(agent.name, response, round_num)
                 transcript.append(turn)
 
+                # Let callers stream the turn before the (slow) summary call
+                if on_turn:
+                    on_turn(turn)
+
                 # Log with summary
                 logger.log_turn_with_summary(turn)
 
@@ -526,6 +722,41 @@ class DebateSession:
 
         return transcript
 
+    def _system_prompt_with_context(self, agent: Agent, context: str) -> str:
+        """Agent system prompt with past-debate context appended (if any)"""
+        system_prompt = agent.get_system_prompt()
+
+        if context:
+            system_prompt += f"\n\n{context}\n\nUse this context to inform your arguments where relevant. You may reference previous discussions."
+
+        return system_prompt
+
+    async def _opening_statements(self,
+                                  agents: List[Agent],
+                                  passage: str,
+                                  context: str,
+                                  is_branch: bool) -> List[str]:
+        """
+        Get every agent's round-1 response concurrently
+
+        Returns:
+            Responses in the same order as agents
+        """
+        if is_branch:
+            user_prompt = f"Question to explore: {passage}\n\nProvide your perspective."
+        else:
+            user_prompt = f"Passage:\n{passage}\n\nProvide your opening analysis."
+
+        return await asyncio.gather(*(
+            llm_call_async(
+                system_prompt=self._system_prompt_with_context(agent, context),
+                user_prompt=user_prompt,
+                temperature=0.7,
+                model="electronhub/claude-sonnet-4-5-20250929"
+            )
+            for agent in agents
+        ))
+
     def _format_branch_context(self,
                                parent_node: ArgumentNode,
                                other_nodes: List[ArgumentNode]) -> str:
@@ -573,18 +804,16 @@ class DebateSession:
     def get_stats(self) -> dict:
         """Get session statistics"""
 
+        # One pass over nodes and edges for the per-type counts
+        node_counts = Counter(node.node_type for node in self.dag.nodes.values())
+        edge_counts = Counter(edge.edge_type for edge in self.dag.edges)
+
         return {
             "session_name": self.session_name,
             "total_nodes": len(self.dag.nodes),
             "total_edges": len(self.dag.edges),
-            "node_types": {
-                ntype.value: len(self.dag.find_nodes_by_type(ntype))
-                for ntype in NodeType
-            },
-            "edge_types": {
-                etype.value: len([e for e in self.dag.edges if e.edge_type == etype])
-                for etype in EdgeType
-            }
+            "node_types": {ntype.value: node_counts[ntype] for ntype in NodeType},
+            "edge_types": {etype.value: edge_counts[etype] for etype in EdgeType}
         }
 
 
@@ -612,9 +841,7 @@ if __name__ == "__main__":
     session = DebateSession("test_session")
 
     # Create logger
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = session.session_dir / f"test_log_{timestamp}.md"
-    logger = Logger(log_file)
+    logger = Logger(session.new_log_path("test_log"))
 
     # Test passage
     passage = "When Zarathustra was thirty years old, he left his home and the lake of his home, and went into the mountains."
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+DAG Layout Tests
+
+Tests the layered layout used to draw the debate graph.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import networkx as nx
+
+from dag_layout import bfs_layers, layered_layout
+
+
+def test_bfs_layers_with_cycle():
+    """Cycles don't stop layering; unreachable nodes start their own BFS"""
+    node_ids = ("root", "a", "b", "c", "x", "y")
+    G = nx.DiGraph()
+    G.add_nodes_from(node_ids)
+    # root -> a -> b <-> c (mutual contradiction); x <-> y reached from no root
+    G.add_edges_from([("root", "a"), ("a", "b"), ("b", "c"), ("c", "b"), ("x", "y"), ("y", "x")])
+
+    assert bfs_layers(G, node_ids) == [["root", "x"], ["a", "y"], ["b"], ["c"]]
+
+
+def test_layered_layout_rows():
+    """Roots on top, one row per generation, rows centered and in insertion order"""
+    node_ids = ("main", "b1", "b2", "b3")
+    edges = (("main", "b1"), ("main", "b2"), ("main", "b3"))
+    pos = layered_layout(node_ids, edges)
+
+    assert pos["main"] == (0.0, 0.0)
+    assert [pos[n][1] for n in ("b1", "b2", "b3")] == [-1.0, -1.0, -1.0]
+    assert [pos[n][0] for n in ("b1", "b2", "b3")] == [-0.5, 0.0, 0.5]
+
+
+def test_layered_layout_keeps_children_under_parents():
+    """Each row is ordered by the mean position of its parents"""
+    node_ids = ("r1", "r2", "c2", "c1")
+    edges = (("r1", "c1"), ("r2", "c2"))
+    pos = layered_layout(node_ids, edges)
+
+    # c2 was inserted first, but c1 sits under r1 on the left
+    assert pos["r1"][0] < pos["r2"][0]
+    assert pos["c1"][0] < pos["c2"][0]
+
+
+def test_layered_layout_cyclic_and_empty():
+    """Graphs with cycles fall back to BFS depth; an empty graph has no positions"""
+    pos = layered_layout(("a", "b"), (("a", "b"), ("b", "a")))
+    assert pos == {"a": (0.0, 0.0), "b": (0.0, -1.0)}
+    assert layered_layout((), ()) == {}
+
+
+def main():
+    """Run all DAG layout tests"""
+    for test in (test_bfs_layers_with_cycle, test_layered_layout_rows,
+                 test_layered_layout_keeps_children_under_parents, test_layered_layout_cyclic_and_empty):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Debate Graph Tests
+
+Tests DebateDAG revision tracking, saving and loading. No LLM calls.
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from debate_graph import DebateDAG, ArgumentNode, Edge, NodeType, EdgeType
+
+
+def _build_dag() -> DebateDAG:
+    """A main node with one branch"""
+    dag = DebateDAG()
+    main_node = ArgumentNode.create(NodeType.EXPLORATION, "Main topic", "Main resolution",
+                                    passage="A passage", theme_tags={"structure"})
+    branch_node = ArgumentNode.create(NodeType.SYNTHESIS, "Branch topic", "Branch resolution",
+                                      branch_question="Why?")
+    dag.add_node(main_node)
+    dag.add_node(branch_node)
+    dag.add_edge(Edge(main_node.node_id, branch_node.node_id, EdgeType.BRANCHES_FROM))
+    return dag
+
+
+def test_revision_counts_insertions():
+    """Every new node/edge bumps the revision; duplicate edges don't"""
+    dag = _build_dag()
+    assert dag.revision == 3
+
+    edge = dag.edges[0]
+    dag.add_edge(Edge(edge.from_node_id, edge.to_node_id, edge.edge_type))
+    assert dag.revision == 3 and len(dag.edges) == 1
+
+
+def test_save_and_load_round_trip():
+    """save writes the whole graph atomically; load rebuilds it at the same revision"""
+    dag = _build_dag()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "dag.json"
+        dag.save(path)
+
+        # The temp file was swapped in, not left behind
+        assert [p.name for p in Path(tmp_dir).iterdir()] == ["dag.json"]
+
+        loaded = DebateDAG.load(path)
+
+    assert list(loaded.nodes) == list(dag.nodes)
+    assert [e.to_dict() for e in loaded.edges] == [e.to_dict() for e in dag.edges]
+    assert loaded.nodes[next(iter(dag.nodes))].theme_tags == {"structure"}
+    assert loaded.revision == dag.revision
+
+
+def test_from_dict_matches_load():
+    """from_dict takes the parsed save data; each graph gets its own instance_id"""
+    dag = _build_dag()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "dag.json"
+        dag.save(path)
+        with open(path) as f:
+            data = json.load(f)
+        loaded = DebateDAG.load(path)
+
+    rebuilt = DebateDAG.from_dict(data)
+    assert list(rebuilt.nodes) == list(loaded.nodes)
+    assert rebuilt.revision == loaded.revision == 3
+    assert len({dag.instance_id, loaded.instance_id, rebuilt.instance_id}) == 3
+
+    assert DebateDAG.from_dict({}).revision == 0
+
+
+def main():
+    """Run all debate graph tests"""
+    for test in (test_revision_counts_insertions, test_save_and_load_round_trip,
+                 test_from_dict_matches_load):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -88,6 +88,9 @@ def main():
     print(f"   Topic: {node2.topic}")
     print(f"   Type: {node2.node_type.value}")
 
+    # Write both nodes to disk
+    session.flush_if_dirty()
+
     # Get stats
     print(f"\n3. Session Statistics:")
     stats = session.get_stats()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+JSON Parsing Tests
+
+Tests extraction of JSON from LLM responses and the batched branch/agent
+response parsers. No LLM calls.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dialectic_poc import extract_json, _parse_branch_batch
+from agent_generation import AGENT_PROFILE_SCHEMA, _extract_json_object, _parse_agent_batch
+from philosophical_traditions import get_maximally_incompatible_traditions
+
+
+def _raises(exc_type, func, *args):
+    """True if func(*args) raises exc_type"""
+    try:
+        func(*args)
+    except exc_type:
+        return True
+    return False
+
+
+def _profile(name: str) -> dict:
+    """A complete Phase 1 agent profile"""
+    profile = {key: f"{key} of {name}" for key in AGENT_PROFILE_SCHEMA['required']}
+    profile['name'] = name
+    return profile
+
+
+def test_extract_json_object():
+    """Fences, surrounding prose and braces inside strings are ignored"""
+    response = 'Here you go:\n```json\n{"a": "} {", "b": {"c": "\\"}"}}\n```\nHope that helps }'
+    assert json.loads(_extract_json_object(response)) == {"a": "} {", "b": {"c": "\"}"}}
+
+    # No object: text comes back as-is; unclosed: from the first brace on
+    assert _extract_json_object("no json here") == "no json here"
+    assert _extract_json_object('x {"a": 1') == '{"a": 1'
+
+
+def test_extract_json_array():
+    """Arrays are extracted the same way, from an optional start offset"""
+    response = 'Answer: ["a ] b", ["nested"]] and [trailing]'
+    assert json.loads(extract_json(response, '[')) == ["a ] b", ["nested"]]
+    assert extract_json(response, '[', response.index('[trailing')) == "[trailing]"
+
+
+def test_parse_branch_batch():
+    """Finds the questions array even after a bracketed aside"""
+    response = 'Sure [note: 2 observers]:\n```json\n["Why [this]?", "  What of that?  "]\n```'
+    assert _parse_branch_batch(response, 2) == ["Why [this]?", "What of that?"]
+
+    assert _raises(ValueError, _parse_branch_batch, '["only one"]', 2)
+    assert _raises(ValueError, _parse_branch_batch, '["", "blank"]', 2)
+    assert _raises(ValueError, _parse_branch_batch, 'no array at all', 2)
+
+
+def test_parse_agent_batch():
+    """Profiles get tradition and cycled model metadata; incomplete ones are rejected"""
+    traditions = get_maximally_incompatible_traditions(3)
+    models = ["model-a", "model-b"]
+    response = "```json\n" + json.dumps({"agents": [_profile(f"P{i}") for i in range(3)]}) + "\n```"
+
+    agents = _parse_agent_batch(response, traditions, models)
+    assert [a['name'] for a in agents] == ["P0", "P1", "P2"]
+    assert [a['model'] for a in agents] == ["model-a", "model-b", "model-a"]
+    assert [a['tradition_name'] for a in agents] == [t.name for t in traditions]
+
+    # Wrong count, or a profile missing a required field
+    short = json.dumps({"agents": [_profile("P0"), _profile("P1")]})
+    assert _raises(ValueError, _parse_agent_batch, short, traditions, models)
+    incomplete = [_profile(f"P{i}") for i in range(3)]
+    del incomplete[1]['core_beliefs']
+    assert _raises(ValueError, _parse_agent_batch, json.dumps({"agents": incomplete}), traditions, models)
+    assert _raises(ValueError, _parse_agent_batch, "not json", traditions, models)
+
+
+def main():
+    """Run all JSON parsing tests"""
+    for test in (test_extract_json_object, test_extract_json_array,
+                 test_parse_branch_batch, test_parse_agent_batch):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
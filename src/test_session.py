@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Session Persistence Tests
+
+Tests when DebateSession writes its DAG (autosave vs. batched flushes).
+Runs in a temporary directory, since sessions write under ./output. No LLM calls.
+"""
+
+import sys
+import os
+import tempfile
+from functools import wraps
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from debate_graph import ArgumentNode, NodeType
+from session import DebateSession
+
+
+def _in_temp_dir(test):
+    """Run test with a fresh temporary directory as the working directory"""
+    @wraps(test)
+    def wrapper():
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                test()
+            finally:
+                os.chdir(cwd)
+    return wrapper
+
+
+def _add_node(session: DebateSession) -> None:
+    """Add a node the way process_passage does, then record the change"""
+    session.dag.add_node(ArgumentNode.create(NodeType.EXPLORATION, "Topic", "Resolution"))
+    session._record_change()
+
+
+@_in_temp_dir
+def test_autosave_writes_immediately():
+    """With autosave (the default), each change is written right away"""
+    session = DebateSession("autosave_test")
+    _add_node(session)
+
+    assert session.dag_path.exists()
+    assert not session.dirty
+    assert session.flush_if_dirty() is False
+
+
+@_in_temp_dir
+def test_flush_if_dirty_batches_writes():
+    """With autosave=False, changes wait for one flush_if_dirty"""
+    session = DebateSession("batched_test", autosave=False)
+    _add_node(session)
+    _add_node(session)
+
+    assert session.dirty
+    assert not session.dag_path.exists()
+
+    assert session.flush_if_dirty() is True
+    assert not session.dirty
+    assert session.flush_if_dirty() is False
+
+    reloaded = DebateSession("batched_test", load_existing=True)
+    assert len(reloaded.dag.nodes) == 2
+    assert reloaded.dag_version == session.dag_version
+
+
+def main():
+    """Run all session persistence tests"""
+    for test in (test_autosave_writes_immediately, test_flush_if_dirty_batches_writes):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Token Budget Tests
+
+Tests trimming of recent debate turns to a prompt token budget.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dialectic_poc import count_tokens, trim_to_token_budget
+
+
+def test_keeps_everything_within_budget():
+    """Lines that fit are all kept, oldest first"""
+    lines = ["A: first", "B: second", "C: third"]
+    assert trim_to_token_budget(lines, budget=1000) == lines
+
+
+def test_drops_oldest_lines_first():
+    """Once over budget, older lines go and the newest ones stay in order"""
+    lines = [f"Agent {i}: " + "word " * 50 for i in range(6)]
+    budget = count_tokens(lines[-1]) + count_tokens(lines[-2])
+
+    kept = trim_to_token_budget(lines, budget=budget)
+    assert kept == lines[-2:]
+    assert sum(count_tokens(line) for line in kept) <= budget
+
+
+def test_always_keeps_newest_line():
+    """A single over-budget turn is still kept rather than sending no context"""
+    lines = ["A: short", "B: " + "very long " * 200]
+    assert trim_to_token_budget(lines, budget=5) == lines[-1:]
+    assert trim_to_token_budget([], budget=5) == []
+
+
+def main():
+    """Run all token budget tests"""
+    for test in (test_keeps_everything_within_budget, test_drops_oldest_lines_first,
+                 test_always_keeps_newest_line):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()